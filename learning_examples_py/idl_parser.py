@@ -5,20 +5,263 @@ Provides functionality to load and parse Anchor IDL files and decode instruction
 
 import json
 import struct
+from functools import lru_cache
+from sys import intern
 from typing import Dict, Any, Optional, List, Tuple, Union
 
 import base58
 
+try:
+    # Optional Rust-backed JSON parser; several times faster than stdlib json
+    # on IDL-sized documents
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional Rust-backed base58 (PyO3); an order of magnitude faster than the
+    # pure-Python big-integer loop in the base58 package
+    from based58 import b58encode as _b58encode
+except ImportError:
+    _b58encode = base58.b58encode
+
+
+@lru_cache(maxsize=4096)
+def _b58_cached(raw: bytes) -> str:
+    """Base58-encode 32 raw bytes, memoized process-wide.
+
+    The same pubkeys (programs, mints, config accounts) recur across
+    transactions constantly; caching turns the repeat encodes into one
+    dict hit each.
+    """
+    return _b58encode(raw).decode('utf-8')
+
 # Constants for Anchor data layout
 DISCRIMINATOR_SIZE = 8
 PUBLIC_KEY_SIZE = 32
 STRING_LENGTH_PREFIX_SIZE = 4
 ENUM_DISCRIMINATOR_SIZE = 1
+# Upper bound for borsh string fields; real metadata strings (name/symbol/URI)
+# stay well under this, anything larger is malformed or adversarial
+MAX_STRING_LENGTH = 8192
+
+# Opcodes for the flat decode programs compiled from the IDL at load time.
+# Primitive opcodes double as indices into _PRIM_READERS.
+_OP_U8 = 0
+_OP_U16 = 1
+_OP_U32 = 2
+_OP_U64 = 3
+_OP_I8 = 4
+_OP_I16 = 5
+_OP_I32 = 6
+_OP_I64 = 7
+_OP_BOOL = 8
+_OP_PUBKEY = 9
+_OP_STRING = 10
+_OP_STRUCT_BEGIN = 11
+_OP_STRUCT_END = 12
+_OP_ARRAY = 13
+_OP_ENUM = 14
+_OP_FIXED_RUN = 15
+
+_PRIM_OPCODES = {
+    'u8': _OP_U8,
+    'u16': _OP_U16,
+    'u32': _OP_U32,
+    'u64': _OP_U64,
+    'i8': _OP_I8,
+    'i16': _OP_I16,
+    'i32': _OP_I32,
+    'i64': _OP_I64,
+    'bool': _OP_BOOL,
+    'pubkey': _OP_PUBKEY,
+    'string': _OP_STRING,
+}
+
+# Format characters for the fixed-width primitive opcodes, used to coalesce
+# runs of adjacent fields into a single combined Struct
+_PRIM_FORMAT_CHARS = ('B', 'H', 'I', 'Q', 'b', 'h', 'i', 'q', '?')
+
+
+# Precompiled Struct objects: unpack_from on these skips the per-call
+# format-string parse that struct.unpack_from(fmt, ...) pays every time
+_U8 = struct.Struct('<B')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+def _make_numeric_reader(fmt: str, size: int):
+    compiled = struct.Struct(fmt)
+    unpack_from = compiled.unpack_from
+
+    def _read(data, offset):
+        return unpack_from(data, offset)[0], offset + size
+    return _read
+
+
+def _read_pubkey(data, offset):
+    end = offset + PUBLIC_KEY_SIZE
+    return _b58_cached(data[offset:end]), end
+
+
+def _read_string(data, offset):
+    length = _U32.unpack_from(data, offset)[0]
+    offset += STRING_LENGTH_PREFIX_SIZE
+    # Reject before slicing: a bogus length field would otherwise trigger a
+    # huge allocation and UTF-8 scan before the decode eventually failed
+    if length > len(data) - offset or length > MAX_STRING_LENGTH:
+        raise ValueError(f"Invalid string length {length} at offset {offset}")
+    value = data[offset:offset + length].decode('utf-8')
+    return value, offset + length
+
+
+# Primitive readers indexed by opcode; each returns (value, new_offset)
+_PRIM_READERS = (
+    _make_numeric_reader('<B', 1),
+    _make_numeric_reader('<H', 2),
+    _make_numeric_reader('<I', 4),
+    _make_numeric_reader('<Q', 8),
+    _make_numeric_reader('<b', 1),
+    _make_numeric_reader('<h', 2),
+    _make_numeric_reader('<i', 4),
+    _make_numeric_reader('<q', 8),
+    _make_numeric_reader('<?', 1),
+    _read_pubkey,
+    _read_string,
+)
+
+
+def _coalesce_fixed_runs(program: list) -> tuple:
+    """Merge adjacent fixed-width primitive ops into combined-Struct reads.
+
+    A run like u8/u64/u64 becomes a single _OP_FIXED_RUN op whose payload is a
+    precompiled Struct covering the whole run plus the field names to zip the
+    unpacked tuple with — one C call instead of one per field.
+    """
+    coalesced: list = []
+    run: list = []
+
+    def flush():
+        if len(run) >= 2:
+            fmt = '<' + ''.join(_PRIM_FORMAT_CHARS[op] for op, _, _ in run)
+            names = tuple(name for _, name, _ in run)
+            coalesced.append((_OP_FIXED_RUN, None, (struct.Struct(fmt), names)))
+        else:
+            coalesced.extend(run)
+        run.clear()
+
+    for op_tuple in program:
+        if op_tuple[0] < _OP_PUBKEY:
+            run.append(op_tuple)
+        else:
+            flush()
+            coalesced.append(op_tuple)
+    flush()
+    return tuple(coalesced)
+
+
+def _matching_struct_end(program: tuple, begin: int) -> int:
+    """Return the index of the _OP_STRUCT_END matching the begin at `begin`."""
+    depth = 1
+    i = begin + 1
+    while depth:
+        op = program[i][0]
+        if op == _OP_STRUCT_BEGIN:
+            depth += 1
+        elif op == _OP_STRUCT_END:
+            depth -= 1
+        i += 1
+    return i - 1
+
+
+def _bind_value_step(name, reader):
+    """Bind a (value, new_offset) reader into a store-into-result step."""
+    def step(data, offset, result):
+        value, offset = reader(data, offset)
+        result[name] = value
+        return offset
+    return step
+
+
+def _bind_fixed_run_step(payload):
+    """Bind a coalesced fixed-width run into a single unpack-and-store step."""
+    struct_obj, names = payload
+    unpack_from = struct_obj.unpack_from
+    size = struct_obj.size
+
+    def step(data, offset, result):
+        result.update(zip(names, unpack_from(data, offset)))
+        return offset + size
+    return step
+
+
+class _LazyAccounts:
+    """Mapping of account name to base58 key that encodes keys on first access.
+
+    decode_instruction used to eagerly base58-encode every account slot of an
+    instruction (10+ for initialize) even though consumers typically read only
+    a handful, so encoding is deferred until a name is actually looked up.
+    Unknown slots or out-of-range indices resolve to None, matching the old
+    eager behaviour.
+    """
+
+    __slots__ = ('_index_by_name', '_keys', '_accounts', '_by_name')
+
+    def __init__(self, index_by_name, keys, accounts):
+        self._index_by_name = index_by_name
+        self._keys = keys
+        self._accounts = accounts
+        self._by_name: Dict[str, Optional[str]] = {}
+
+    def __getitem__(self, name: str) -> Optional[str]:
+        by_name = self._by_name
+        if name in by_name:
+            return by_name[name]
+        index = self._index_by_name[name]  # Raises KeyError for unknown names
+        value = None
+        accounts = self._accounts
+        if index < len(accounts):
+            account_index = accounts[index]
+            keys = self._keys
+            if account_index < len(keys):
+                value = _b58_cached(keys[account_index])
+        by_name[name] = value
+        return value
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index_by_name
+
+    def __iter__(self):
+        return iter(self._index_by_name)
+
+    def __len__(self) -> int:
+        return len(self._index_by_name)
+
+    def keys(self):
+        return self._index_by_name.keys()
+
+    def items(self):
+        return ((name, self[name]) for name in self._index_by_name)
 
 
 class IDLParser:
     """Parser for automatically decoding instructions using IDL definitions."""
 
+    # Fixed attribute layout: per-decode access to instructions/_decoders/
+    # instruction_min_sizes becomes an offset load instead of a __dict__ lookup
+    __slots__ = (
+        'verbose', 'idl', 'instructions', 'types', 'instruction_min_sizes',
+        '_decoders', '_type_decoders', '_compiled_types', '_account_indexes',
+        '_disc_by_name', '_names', '_dispatch', '_defined_size_cache',
+    )
+
     # A single source of truth for primitive type information, mapping the type name
     # to its struct format character and size in bytes.
     _PRIMITIVE_TYPE_INFO = {
@@ -45,14 +288,24 @@ class IDLParser:
             verbose: Whether to print debug information during initialization
         """
         self.verbose = verbose
-        with open(idl_path, 'r') as f:
-            self.idl = json.load(f)
-        self.instructions: Dict[bytes, Dict[str, Any]] = {}
+        with open(idl_path, 'rb') as f:
+            self.idl = _json_loads(f.read())
+        # Instruction maps are keyed by the discriminator as a little-endian
+        # u64: hashing a small int is a single C op versus SipHash over an
+        # 8-byte bytes object, and the lookup needs no ix_data[:8] slice
+        self.instructions: Dict[int, Dict[str, Any]] = {}
         self.types: Dict[str, Dict[str, Any]] = {}
-        self.instruction_min_sizes: Dict[bytes, int] = {}
+        self.instruction_min_sizes: Dict[int, int] = {}
+        self._decoders: Dict[int, Any] = {}
+        self._dispatch: Dict[int, tuple] = {}
+        self._type_decoders: Dict[str, Any] = {}
+        self._compiled_types: Dict[str, tuple] = {}
+        self._account_indexes: Dict[int, Dict[str, int]] = {}
+        self._defined_size_cache: Dict[str, int] = {}
         self._build_instruction_map()
         self._build_type_map()
         self._calculate_instruction_sizes()
+        self._compile_programs()
 
     # --------------------------------------------------------------------------
     # Public Methods (External API)
@@ -60,13 +313,13 @@ class IDLParser:
 
     def get_instruction_discriminators(self) -> Dict[str, bytes]:
         """Get a mapping of instruction names to their discriminators."""
-        return {instr['name']: disc for disc, instr in self.instructions.items()}
+        return self._disc_by_name
 
     def get_instruction_names(self) -> List[str]:
         """Get a list of all available instruction names."""
-        return [instr['name'] for instr in self.instructions.values()]
+        return self._names
 
-    def validate_instruction_data_length(self, ix_data: bytes, discriminator: bytes) -> bool:
+    def validate_instruction_data_length(self, ix_data: bytes, discriminator: int) -> bool:
         """Validate that instruction data meets minimum length requirements."""
         if discriminator not in self.instruction_min_sizes:
             return True  # Allow if we don't know the expected size
@@ -90,44 +343,37 @@ class IDLParser:
         if len(ix_data) < DISCRIMINATOR_SIZE:
             return None
 
-        discriminator = ix_data[:DISCRIMINATOR_SIZE]
-        if discriminator not in self.instructions:
+        # One hash probe resolves name, minimum size, bound decoder, and the
+        # account-index map together; unknown discriminators exit immediately
+        entry = self._dispatch.get(_U64.unpack_from(ix_data)[0])
+        if entry is None:
             return None
+        name, min_size, decoder, account_index = entry
 
-        if not self.validate_instruction_data_length(ix_data, discriminator):
+        # Single up-front bounds check against the precomputed minimum size;
+        # past this point the fixed-width portion is known to be in range
+        if len(ix_data) < min_size:
+            if self.verbose:
+                print(
+                    f"⚠️  Instruction data for '{name}' is shorter than the expected minimum "
+                    f"({len(ix_data)}/{min_size} bytes)."
+                )
             return None
 
-        instruction = self.instructions[discriminator]
-        data_args = ix_data[DISCRIMINATOR_SIZE:]
-        
-        # Decode instruction arguments
-        args = {}
-        decode_offset = 0
-        for arg in instruction.get('args', []):
-            try:
-                value, decode_offset = self._decode_type(data_args, decode_offset, arg['type'])
-                args[arg['name']] = value
-            except Exception as e:
-                if self.verbose:
-                    print(f"❌ Decode error in argument '{arg['name']}': {e}")
-                return None
-
-        # Helper to safely retrieve account public keys
-        def get_account_key(index: int) -> Optional[str]:
-            if index < len(accounts):
-                account_index = accounts[index]
-                if account_index < len(keys):
-                    return base58.b58encode(keys[account_index]).decode('utf-8')
-            return None # Return None for invalid indices
+        # Decode instruction arguments with the decoder bound at load time
+        try:
+            args, _ = decoder(ix_data, DISCRIMINATOR_SIZE)
+        except Exception as e:
+            if self.verbose:
+                print(f"❌ Decode error in instruction '{name}': {e}")
+            return None
 
-        # Build account info based on instruction definition
-        account_info = {}
-        instruction_accounts = instruction.get('accounts', [])
-        for i, account_def in enumerate(instruction_accounts):
-            account_info[account_def['name']] = get_account_key(i)
+        # Account keys are resolved lazily: a name is base58-encoded only when
+        # it is actually read, and repeated indices are encoded once
+        account_info = _LazyAccounts(account_index, keys, accounts)
 
         return {
-            'instruction_name': instruction['name'],
+            'instruction_name': name,
             'args': args,
             'accounts': account_info
         }
@@ -135,19 +381,20 @@ class IDLParser:
     def decode_account_data(self, account_data: bytes, account_type_name: str, skip_discriminator: bool = True) -> Optional[Dict[str, Any]]:
         """
         Decode account data using a specific account type from the IDL.
-        
+
         Args:
             account_data: Raw account data bytes.
             account_type_name: Name of the account type in the IDL (e.g., "MyAccount").
             skip_discriminator: Whether to skip the first 8 bytes, which Anchor uses as a
                                 type discriminator for account data. Set to False if your
                                 data does not have this prefix.
-                                
+
         Returns:
             Decoded account data as a dictionary, or None if decoding fails.
         """
         try:
-            if account_type_name not in self.types:
+            decoder = self._type_decoders.get(account_type_name)
+            if decoder is None:
                 if self.verbose:
                     print(f"Account type '{account_type_name}' not found in IDL")
                 return None
@@ -160,7 +407,7 @@ class IDLParser:
                     return None
                 data = account_data[DISCRIMINATOR_SIZE:]
 
-            decoded_data, _ = self._decode_defined_type(data, 0, account_type_name)
+            decoded_data, _ = decoder(data, 0)
             return decoded_data
 
         except Exception as e:
@@ -175,9 +422,22 @@ class IDLParser:
     def _build_instruction_map(self):
         """Build a map of discriminators to instruction definitions."""
         for instruction in self.idl.get('instructions', []):
-            # The discriminator from the JSON IDL is a list of u8 integers.
-            discriminator = bytes(instruction['discriminator'])
+            # The discriminator from the JSON IDL is a list of u8 integers,
+            # packed here into the little-endian u64 used as the map key.
+            discriminator = _U64.unpack(bytes(instruction['discriminator']))[0]
+            instruction['name'] = intern(instruction['name'])
             self.instructions[discriminator] = instruction
+            # Account positions are fixed per instruction, so the name-to-slot
+            # map is built once here rather than per decoded transaction
+            self._account_indexes[discriminator] = {
+                intern(account_def['name']): i
+                for i, account_def in enumerate(instruction.get('accounts', []))
+            }
+        # The IDL is immutable after init, so the accessor results are built
+        # once here instead of per call
+        self._disc_by_name = {instr['name']: disc.to_bytes(8, 'little')
+                              for disc, instr in self.instructions.items()}
+        self._names = [instr['name'] for instr in self.instructions.values()]
 
     def _build_type_map(self):
         """Build a map of type names to their definitions."""
@@ -201,10 +461,13 @@ class IDLParser:
 
     def _calculate_type_min_size(self, type_def: Union[str, Dict]) -> int:
         """Calculate minimum size in bytes for a type definition."""
-        if isinstance(type_def, str):
+        # type() is a single pointer compare; isinstance walks the MRO and the
+        # IDL never subclasses str/dict
+        t = type(type_def)
+        if t is str:
             return self._get_primitive_size(type_def)
-        
-        if isinstance(type_def, dict):
+
+        if t is dict:
             if 'defined' in type_def:
                 type_name = self._get_defined_type_name(type_def)
                 return self._calculate_defined_type_min_size(type_name)
@@ -212,7 +475,7 @@ class IDLParser:
                 element_type, array_length = type_def['array']
                 element_size = self._calculate_type_min_size(element_type)
                 return element_size * array_length
-        
+
         raise ValueError(f"Invalid or unknown type definition for size calculation: {type_def}")
 
     def _get_primitive_size(self, type_name: str) -> int:
@@ -225,127 +488,283 @@ class IDLParser:
         defined_value = type_def['defined']
         # New format: {'defined': {'name': 'MyType'}}
         # Old format: {'defined': 'MyType'}
-        return defined_value['name'] if isinstance(defined_value, dict) else defined_value
+        return defined_value['name'] if type(defined_value) is dict else defined_value
 
     def _calculate_defined_type_min_size(self, type_name: str) -> int:
-        """Calculate minimum size for user-defined types (structs and enums)."""
+        """Calculate minimum size for user-defined types (structs and enums).
+
+        Memoized per type name: Anchor IDLs reuse the same structs across many
+        instructions, so each is sized once instead of per referencing field.
+        """
+        cached = self._defined_size_cache.get(type_name)
+        if cached is not None:
+            return cached
+
         if type_name not in self.types:
             raise ValueError(f"Unknown defined type: {type_name}")
-        
+
         type_def = self.types[type_name]['type']
-        
+
         if type_def['kind'] == 'struct':
-            return sum(self._calculate_type_min_size(field['type']) for field in type_def['fields'])
-        
+            size = sum(self._calculate_type_min_size(field['type']) for field in type_def['fields'])
+            self._defined_size_cache[type_name] = size
+            return size
+
         if type_def['kind'] == 'enum':
             # The size of an enum is its discriminator plus the size of its LARGEST variant,
             # as the data layout must accommodate any possible variant.
-            max_variant_size = 0
-            for variant in type_def['variants']:
-                variant_size = 0
-                for field in variant.get('fields', []):
-                    # A field can be a type string/dict (tuple variant) or a dict with a 'type' key (struct variant)
-                    field_type = field['type'] if isinstance(field, dict) else field
-                    variant_size += self._calculate_type_min_size(field_type)
-                max_variant_size = max(max_variant_size, variant_size)
-            return ENUM_DISCRIMINATOR_SIZE + max_variant_size
+            # A field can be a type string/dict (tuple variant) or a dict with a 'type' key (struct variant)
+            max_variant_size = max(
+                (sum(self._calculate_type_min_size(field['type'] if type(field) is dict else field)
+                     for field in variant.get('fields', []))
+                 for variant in type_def['variants']),
+                default=0,
+            )
+            size = ENUM_DISCRIMINATOR_SIZE + max_variant_size
+            self._defined_size_cache[type_name] = size
+            return size
 
         raise ValueError(f"Unsupported type kind for size calculation: {type_def['kind']}")
 
-    def _decode_type(self, data: bytes, offset: int, type_def: Union[str, Dict]) -> Tuple[Any, int]:
-        """Decode a value based on its type definition."""
-        if isinstance(type_def, str):
-            return self._decode_primitive(data, offset, type_def)
-        
-        if isinstance(type_def, dict):
+    # --------------------------------------------------------------------------
+    # Decode Program Compilation (runs once at load time)
+    # --------------------------------------------------------------------------
+
+    def _compile_programs(self):
+        """Compile every instruction and defined type into bound decoder functions.
+
+        Walking the IDL JSON happens here, once, instead of on every decode:
+        each instruction's argument list becomes a flat tuple of
+        (opcode, field_name, payload) ops, which `_bind_program` then turns
+        into a specialized decoder function whose readers, Structs, and field
+        names are resolved into closure cells — the hot path runs no opcode
+        dispatch at all.
+        """
+        for type_name in self.types:
+            self._compiled_types[type_name] = self._compile_defined(type_name)
+        for type_name, compiled in self._compiled_types.items():
+            self._type_decoders[type_name] = self._bind_value(compiled)
+        for discriminator, instruction in self.instructions.items():
+            program: list = []
+            for arg in instruction.get('args', []):
+                self._compile_field(arg['name'], arg['type'], program)
+            decoder = self._bind_program(_coalesce_fixed_runs(program))
+            self._decoders[discriminator] = decoder
+            # Everything decode_instruction needs behind one hash probe
+            self._dispatch[discriminator] = (
+                instruction['name'],
+                self.instruction_min_sizes[discriminator],
+                decoder,
+                self._account_indexes[discriminator],
+            )
+
+    def _compile_field(self, name: str, type_def: Union[str, Dict], program: list):
+        """Append the decode ops for a single named field to a program."""
+        # Interned names share one string object across the compiled programs,
+        # so the per-decode dict stores hit the cached hash and compare by
+        # identity instead of re-hashing fresh strings from the JSON
+        name = intern(name)
+        t = type(type_def)
+        if t is str:
+            program.append((_PRIM_OPCODES[type_def], name, None))
+            return
+        if t is dict:
             if 'defined' in type_def:
-                type_name = self._get_defined_type_name(type_def)
-                return self._decode_defined_type(data, offset, type_name)
+                kind, payload = self._compile_defined(self._get_defined_type_name(type_def))
+                if kind == 'struct':
+                    # Inline nested struct fields so the runtime stays a flat loop
+                    program.append((_OP_STRUCT_BEGIN, name, None))
+                    program.extend(payload)
+                    program.append((_OP_STRUCT_END, None, None))
+                else:
+                    program.append((_OP_ENUM, name, payload))
+                return
             if 'array' in type_def:
-                return self._decode_array(data, offset, type_def['array'])
-        
-        raise ValueError(f"Invalid or unknown type definition for decoding: {type_def}")
-
-    def _decode_array(self, data: bytes, offset: int, array_def: List) -> Tuple[List[Any], int]:
-        """Decode fixed-size array types."""
-        element_type, array_length = array_def
-        array_data = []
-        for _ in range(array_length):
-            value, offset = self._decode_type(data, offset, element_type)
-            array_data.append(value)
-        return array_data, offset
-
-    def _decode_primitive(self, data: bytes, offset: int, type_name: str) -> Tuple[Any, int]:
-        """Decode primitive types."""
-        if type_name not in self._PRIMITIVE_TYPE_INFO:
-            raise ValueError(f"Unknown primitive type: {type_name}")
-
-        if type_name == 'string':
-            length = struct.unpack_from('<I', data, offset)[0]
-            offset += STRING_LENGTH_PREFIX_SIZE
-            value = data[offset:offset + length].decode('utf-8')
-            return value, offset + length
-
-        if type_name == 'pubkey':
-            end = offset + PUBLIC_KEY_SIZE
-            value = base58.b58encode(data[offset:end]).decode('utf-8')
-            return value, end
-
-        # Handle all numeric and bool types from the map
-        fmt, size = self._PRIMITIVE_TYPE_INFO[type_name]
-        value = struct.unpack_from(fmt, data, offset)[0]
-        return value, offset + size
-
-    def _decode_defined_type(self, data: bytes, offset: int, type_name: str) -> Tuple[Dict[str, Any], int]:
-        """Decode user-defined types (structs and enums)."""
+                element_type, array_length = type_def['array']
+                program.append((_OP_ARRAY, name, (self._compile_value(element_type), array_length)))
+                return
+        raise ValueError(f"Invalid or unknown type definition for compilation: {type_def}")
+
+    def _compile_value(self, type_def: Union[str, Dict]) -> tuple:
+        """Compile a type producing a single value (array element or tuple-variant field)."""
+        t = type(type_def)
+        if t is str:
+            return ('prim', _PRIM_OPCODES[type_def])
+        if t is dict:
+            if 'defined' in type_def:
+                return self._compile_defined(self._get_defined_type_name(type_def))
+            if 'array' in type_def:
+                element_type, array_length = type_def['array']
+                return ('array', (self._compile_value(element_type), array_length))
+        raise ValueError(f"Invalid or unknown type definition for compilation: {type_def}")
+
+    def _compile_defined(self, type_name: str) -> tuple:
+        """Compile a user-defined type into ('struct', program) or ('enum', payload)."""
+        compiled = self._compiled_types.get(type_name)
+        if compiled is not None:
+            return compiled
+
         if type_name not in self.types:
             raise ValueError(f"Unknown defined type: {type_name}")
-        
+
         type_def = self.types[type_name]['type']
 
         if type_def['kind'] == 'struct':
-            struct_data = {}
+            program: list = []
             for field in type_def['fields']:
-                value, offset = self._decode_type(data, offset, field['type'])
-                struct_data[field['name']] = value
-            return struct_data, offset
-        
-        if type_def['kind'] == 'enum':
-            variant_index = struct.unpack_from('<B', data, offset)[0]
-            offset += ENUM_DISCRIMINATOR_SIZE
-            
-            variants = type_def['variants']
-            if variant_index >= len(variants):
-                raise ValueError(f"Invalid enum variant index {variant_index} for type {type_name}")
-            
-            variant = variants[variant_index]
-            result = {"variant": variant['name']}
-            variant_fields = variant.get('fields', [])
-
-            if variant_fields:
-                # Check if it's a struct variant (fields are dicts) or tuple variant (fields are strings/dicts)
-                if isinstance(variant_fields[0], dict):
-                    struct_data = {}
+                self._compile_field(field['name'], field['type'], program)
+            compiled = ('struct', _coalesce_fixed_runs(program))
+        elif type_def['kind'] == 'enum':
+            variants = []
+            for variant in type_def['variants']:
+                variant_fields = variant.get('fields', [])
+                if not variant_fields:
+                    variants.append((intern(variant['name']), None, None))
+                elif type(variant_fields[0]) is dict and 'type' in variant_fields[0]:
+                    # Struct variant: named fields
+                    program = []
                     for field in variant_fields:
-                        value, offset = self._decode_type(data, offset, field['type'])
-                        struct_data[field['name']] = value
-                    result['data'] = struct_data
-                else: # Tuple variant
-                    tuple_data = []
-                    for field_type in variant_fields:
-                        value, offset = self._decode_type(data, offset, field_type)
-                        tuple_data.append(value)
-                    result['data'] = tuple_data
-            
-            return result, offset
+                        self._compile_field(field['name'], field['type'], program)
+                    variants.append((intern(variant['name']), 'struct', _coalesce_fixed_runs(program)))
+                else:
+                    # Tuple variant: bare types
+                    variants.append((intern(variant['name']), 'tuple',
+                                     tuple(self._compile_value(f) for f in variant_fields)))
+            compiled = ('enum', (type_name, tuple(variants)))
+        else:
+            raise ValueError(f"Unsupported type kind for compilation: {type_def['kind']}")
+
+        self._compiled_types[type_name] = compiled
+        return compiled
 
-        raise ValueError(f"Unsupported type kind for decoding: {type_def['kind']}")
+    # --------------------------------------------------------------------------
+    # Decoder Binding (runs once at load time)
+    # --------------------------------------------------------------------------
+
+    def _bind_program(self, program: tuple):
+        """Bind a compiled program into a function returning (result_dict, offset).
 
+        Each op becomes a step closure with its reader already resolved; the
+        returned function just threads the offset through the steps.
+
+        Programs whose whole layout coalesced into one fixed-width run (no
+        strings, enums, or nested variable types) skip the step loop entirely:
+        one unpack_from and one dict build.
+        """
+        if len(program) == 1 and program[0][0] == _OP_FIXED_RUN:
+            struct_obj, names = program[0][2]
+            unpack_from = struct_obj.unpack_from
+            size = struct_obj.size
 
+            def run_fixed(data, offset):
+                return dict(zip(names, unpack_from(data, offset))), offset + size
+            return run_fixed
+
+        steps = self._bind_steps(program)
+
+        def run(data, offset):
+            result: Dict[str, Any] = {}
+            for step in steps:
+                offset = step(data, offset, result)
+            return result, offset
+        return run
+
+    def _bind_steps(self, program: tuple) -> tuple:
+        """Turn a flat op tuple into a tuple of bound step closures."""
+        steps = []
+        i = 0
+        n = len(program)
+        while i < n:
+            op, name, payload = program[i]
+            if op < _OP_STRUCT_BEGIN:
+                steps.append(_bind_value_step(name, _PRIM_READERS[op]))
+            elif op == _OP_FIXED_RUN:
+                steps.append(_bind_fixed_run_step(payload))
+            elif op == _OP_STRUCT_BEGIN:
+                end = _matching_struct_end(program, i)
+                steps.append(_bind_value_step(name, self._bind_program(program[i + 1:end])))
+                i = end
+            elif op == _OP_ENUM:
+                steps.append(_bind_value_step(name, self._bind_enum(payload)))
+            else:  # _OP_ARRAY
+                steps.append(_bind_value_step(name, self._bind_array(payload)))
+            i += 1
+        return tuple(steps)
+
+    def _bind_enum(self, payload: tuple):
+        """Bind an enum's per-variant programs into a (value, offset) reader.
+
+        Each variant gets its own bound reader, so runtime dispatch is a
+        direct byte index into a tuple — no mode branching per decode.
+        """
+        type_name, variants = payload
+        readers = []
+        for variant_name, mode, variant_payload in variants:
+            if mode == 'struct':
+                run_struct = self._bind_program(variant_payload)
+
+                def read_variant(data, offset, _name=variant_name, _run=run_struct):
+                    data_value, offset = _run(data, offset)
+                    return {"variant": _name, "data": data_value}, offset
+            elif mode == 'tuple':
+                value_readers = tuple(self._bind_value(c) for c in variant_payload)
+
+                def read_variant(data, offset, _name=variant_name, _readers=value_readers):
+                    tuple_data = []
+                    for read_value in _readers:
+                        value, offset = read_value(data, offset)
+                        tuple_data.append(value)
+                    return {"variant": _name, "data": tuple_data}, offset
+            else:
+                def read_variant(data, offset, _name=variant_name):
+                    return {"variant": _name}, offset
+            readers.append(read_variant)
+        variant_readers = tuple(readers)
+        num_variants = len(variant_readers)
+
+        def read_enum(data, offset):
+            # Indexing a bytes object yields the int directly, skipping the
+            # Struct.unpack_from call and its one-element tuple
+            variant_index = data[offset]
+            if variant_index >= num_variants:
+                raise ValueError(f"Invalid enum variant index {variant_index} for type {type_name}")
+            return variant_readers[variant_index](data, offset + ENUM_DISCRIMINATOR_SIZE)
+        return read_enum
+
+    def _bind_array(self, payload: tuple):
+        """Bind a fixed-length array into a (list, offset) reader."""
+        element, array_length = payload
+        read_element = self._bind_value(element)
+
+        def read_array(data, offset):
+            array_data = []
+            for _ in range(array_length):
+                value, offset = read_element(data, offset)
+                array_data.append(value)
+            return array_data, offset
+        return read_array
+
+    def _bind_value(self, compiled: tuple):
+        """Bind a compiled value (primitive, struct, enum, or array) to a reader."""
+        kind, payload = compiled
+        if kind == 'prim':
+            return _PRIM_READERS[payload]
+        if kind == 'struct':
+            return self._bind_program(payload)
+        if kind == 'enum':
+            return self._bind_enum(payload)
+        return self._bind_array(payload)
+
+
+@lru_cache(maxsize=None)
 def load_idl_parser(idl_path: str, verbose: bool = False) -> IDLParser:
     """
     Convenience function to load an IDL parser.
 
+    The result is memoized per (idl_path, verbose): re-parsing the JSON and
+    recompiling the decode programs on every call would repeat work the
+    parser only needs to do once per process.
+
     Args:
         idl_path: Path to the IDL JSON file
         verbose: Whether to print debug information
@@ -353,4 +772,4 @@ def load_idl_parser(idl_path: str, verbose: bool = False) -> IDLParser:
     Returns:
         Initialized IDLParser instance
     """
-    return IDLParser(idl_path, verbose)
\ No newline at end of file
+    return IDLParser(idl_path, verbose)
@@ -8,7 +8,7 @@ Key features:
 - Uses buy_exact_in instruction
 - Implements proper account ordering as per IDL
 - Includes slippage protection with minimum_amount_out
-- Handles WSOL wrapping/unwrapping automatically
+- Funds a persistent WSOL ATA via transfer + SyncNative (no throwaway accounts)
 - Follows the exact transaction structure from the Solscan example
 - User configurable SOL amount and slippage
 - Uses idempotent ATA creation
@@ -18,6 +18,7 @@ import asyncio
 import os
 import struct
 import sys
+from functools import lru_cache
 from typing import Optional
 
 import base58
@@ -30,7 +31,7 @@ from solders.instruction import AccountMeta, Instruction
 from solders.keypair import Keypair
 from solders.message import Message
 from solders.pubkey import Pubkey
-from solders.system_program import CreateAccountWithSeedParams, create_account_with_seed
+from solders.system_program import TransferParams, transfer
 from solders.transaction import VersionedTransaction
 
 from idl_parser import load_idl_parser
@@ -43,14 +44,28 @@ load_dotenv()
 
 TOKEN_MINT_ADDRESS = Pubkey.from_string("CKyveMBB55WkfZrELaUWnA3R74RTQEmLYhi8m3v4bonk")  # Replace with actual token mint address
 
-# Configuration constants
+# Configuration constants, validated eagerly so a misconfigured process
+# fails at startup instead of after the first RPC round-trip
 RPC_ENDPOINT = os.environ.get("SOLANA_NODE_RPC_ENDPOINT")
-PRIVATE_KEY = base58.b58decode(os.environ.get("SOLANA_PRIVATE_KEY"))
-PAYER = Keypair.from_bytes(PRIVATE_KEY)
+if not RPC_ENDPOINT:
+    sys.exit("SOLANA_NODE_RPC_ENDPOINT is not set")
+
+_private_key_b58 = os.environ.get("SOLANA_PRIVATE_KEY")
+if not _private_key_b58:
+    sys.exit("SOLANA_PRIVATE_KEY is not set")
+try:
+    PRIVATE_KEY = base58.b58decode(_private_key_b58)
+    PAYER = Keypair.from_bytes(PRIVATE_KEY)
+except ValueError as e:
+    sys.exit(f"SOLANA_PRIVATE_KEY is not a valid base58 keypair: {e}")
 
 # User configurable parameters
 SOL_AMOUNT_TO_SPEND = float(os.environ.get("SOL_AMOUNT", "0.001"))
 SLIPPAGE_TOLERANCE = float(os.environ.get("SLIPPAGE", "0.25"))
+if SOL_AMOUNT_TO_SPEND <= 0:
+    sys.exit("SOL_AMOUNT must be positive")
+if not 0 <= SLIPPAGE_TOLERANCE < 1:
+    sys.exit("SLIPPAGE must be in [0, 1)")
 
 # Transaction parameters
 SHARE_FEE_RATE = 0
@@ -71,12 +86,58 @@ SYSTEM_RENT_PROGRAM_ID = Pubkey.from_string("SysvarRent1111111111111111111111111
 # Instruction discriminator for buy_exact_in (from IDL)
 BUY_EXACT_IN_DISCRIMINATOR = bytes([250, 234, 13, 123, 213, 156, 19, 236])
 
+# SyncNative instruction discriminator (instruction 17 in Token Program)
+SYNC_NATIVE_INSTRUCTION_DATA = bytes([17])
+
+# CreateIdempotent instruction discriminator (instruction 1 in ATA Program)
+CREATE_ATA_IDEMPOTENT_INSTRUCTION_DATA = bytes([1])
+
+# Full buy_exact_in payload packed in one call: discriminator + amount_in +
+# minimum_amount_out + share_fee_rate, no intermediate concatenations
+_BUY_EXACT_IN_STRUCT = struct.Struct("<8sQQQ")
+
+# PDAs that are constants of the program, derived once at import: each
+# find_program_address is a bump search running SHA-256 per attempt, so there
+# is no reason to repeat it per buy
+AUTHORITY_PDA = Pubkey.find_program_address([b"vault_auth_seed"], RAYDIUM_LAUNCHLAB_PROGRAM_ID)[0]
+EVENT_AUTHORITY_PDA = Pubkey.find_program_address([b"__event_authority"], RAYDIUM_LAUNCHLAB_PROGRAM_ID)[0]
+
+# Constant seeds for pool-state derivation; only bytes(base_token_mint) needs
+# to be built per call
+_POOL_SEED_PREFIX = b"pool"
+_WSOL_MINT_BYTES = bytes(WSOL_MINT)
+
+# base_vault and quote_vault sit back to back at byte 269 of the PoolState
+# account (8-byte discriminator + fixed-size fields before them); one
+# precompiled unpack pulls both without a base58 round trip
+POOL_VAULTS_OFFSET = 269
+_POOL_VAULTS_STRUCT = struct.Struct("<32s32s")
+
+# PAYER_PUBKEY crosses into Rust on every call; the key never changes
+PAYER_PUBKEY = PAYER.pubkey()
+
+# AccountMetas that are identical on every buy, built once at import so the
+# per-transaction accounts list only allocates the metas that actually vary
+_PAYER_META = AccountMeta(pubkey=PAYER_PUBKEY, is_signer=True, is_writable=True)
+_AUTHORITY_META = AccountMeta(pubkey=AUTHORITY_PDA, is_signer=False, is_writable=False)
+_GLOBAL_CONFIG_META = AccountMeta(pubkey=GLOBAL_CONFIG, is_signer=False, is_writable=False)
+_PLATFORM_CONFIG_META = AccountMeta(pubkey=LETSBONK_PLATFORM_CONFIG, is_signer=False, is_writable=False)
+_WSOL_MINT_META = AccountMeta(pubkey=WSOL_MINT, is_signer=False, is_writable=False)
+_TOKEN_PROGRAM_META = AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False)
+_EVENT_AUTHORITY_META = AccountMeta(pubkey=EVENT_AUTHORITY_PDA, is_signer=False, is_writable=False)
+_LAUNCHLAB_PROGRAM_META = AccountMeta(pubkey=RAYDIUM_LAUNCHLAB_PROGRAM_ID, is_signer=False, is_writable=False)
+
 # Compute budget settings
 COMPUTE_UNIT_LIMIT = 87_000
 COMPUTE_UNIT_PRICE = 1_000 
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
+# Hot-path toggles: simulation and blocking confirmation both add an RPC
+# round-trip per buy, so they are opt-in via the environment
+DEBUG_SIMULATE = bool(os.environ.get("DEBUG_SIMULATE"))
+WAIT_FOR_CONFIRMATION = bool(os.environ.get("WAIT_FOR_CONFIRMATION"))
+
 
 def derive_authority_pda() -> Pubkey:
     """
@@ -88,12 +149,7 @@ def derive_authority_pda() -> Pubkey:
     Returns:
         Pubkey: The derived authority PDA
     """
-    AUTH_SEED = b"vault_auth_seed"
-    authority_pda, _ = Pubkey.find_program_address(
-        [AUTH_SEED],
-        RAYDIUM_LAUNCHLAB_PROGRAM_ID
-    )
-    return authority_pda
+    return AUTHORITY_PDA
 
 
 def derive_event_authority_pda() -> Pubkey:
@@ -105,27 +161,38 @@ def derive_event_authority_pda() -> Pubkey:
     Returns:
         Pubkey: The derived event authority PDA
     """
-    EVENT_AUTHORITY_SEED = b"__event_authority"
-    event_authority_pda, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        RAYDIUM_LAUNCHLAB_PROGRAM_ID
-    )
-    return event_authority_pda
+    return EVENT_AUTHORITY_PDA
 
 
+@lru_cache(maxsize=4096)
 def derive_pool_state_for_token(base_token_mint: Pubkey) -> Optional[Pubkey]:
     """
     Derive the pool state account for a given base token mint.
     
+    The derivation is deterministic, so repeat buys into the same mint hit
+    the cache instead of re-running the bump search.
+    
     Args:
         base_token_mint: The token mint address to search for
         
     Returns:
         Pubkey of the pool state account, or None if not found
     """
-    seeds = [b"pool", bytes(base_token_mint), bytes(WSOL_MINT)]
-    pool_state_pda, _ = Pubkey.find_program_address(seeds, RAYDIUM_LAUNCHLAB_PROGRAM_ID)
-    return pool_state_pda
+    return Pubkey.find_program_address(
+        [_POOL_SEED_PREFIX, bytes(base_token_mint), _WSOL_MINT_BYTES],
+        RAYDIUM_LAUNCHLAB_PROGRAM_ID,
+    )[0]
+
+
+# Vault addresses are fixed for the lifetime of a pool; cache them per pool
+# state so repeat buys skip the byte extraction (the account itself is still
+# re-fetched every buy because the reserves move)
+_POOL_VAULTS_CACHE: dict = {}
+
+# Per-mint instruction scaffold: for repeat buys into the same mint, only the
+# two amount fields, the WSOL funding transfer, and the blockhash change, so
+# the account list and the fixed instructions are built once and reused
+_BUY_TEMPLATE_CACHE: dict = {}
 
 def decode_pool_state(account_data: bytes) -> Optional[dict]:
     """
@@ -175,11 +242,13 @@ async def get_pool_state_data(client: AsyncClient, pool_state: Pubkey) -> Option
         return None
 
 
+@lru_cache(maxsize=1024)
 def get_associated_token_address(owner: Pubkey, mint: Pubkey) -> Pubkey:
     """
     Calculate the associated token account address for a given owner and mint.
     
     This manually implements the ATA derivation without requiring the spl-token package.
+    The result is cached per (owner, mint): repeated buys skip the curve-point search.
     
     Args:
         owner: The wallet that owns the token account
@@ -224,105 +293,37 @@ def create_associated_token_account_idempotent_instruction(payer: Pubkey, owner:
         AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),   # Token program
     ]
     
-    data = bytes([1])
-    
     return Instruction(
         program_id=ASSOCIATED_TOKEN_PROGRAM_ID,
-        data=data,
+        data=CREATE_ATA_IDEMPOTENT_INSTRUCTION_DATA,
         accounts=accounts
     )
 
 
-def create_initialize_account_instruction(account: Pubkey, mint: Pubkey, owner: Pubkey) -> Instruction:
+def create_sync_native_instruction(account: Pubkey) -> Instruction:
     """
-    Create an InitializeAccount instruction for the Token Program.
+    Create a SyncNative instruction for the Token Program.
     
-    Args:
-        account: The account to initialize
-        mint: The token mint
-        owner: The account owner
-        
-    Returns:
-        Instruction for initializing the account
-    """
-    accounts = [
-        AccountMeta(pubkey=account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=owner, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=SYSTEM_RENT_PROGRAM_ID, is_signer=False, is_writable=False),
-    ]
-    
-    # InitializeAccount instruction discriminator (instruction 1 in Token Program)
-    data = bytes([1])
-    
-    return Instruction(
-        program_id=TOKEN_PROGRAM_ID,
-        data=data,
-        accounts=accounts
-    )
-
-
-def create_close_account_instruction(account: Pubkey, destination: Pubkey, owner: Pubkey) -> Instruction:
-    """
-    Create a CloseAccount instruction for the Token Program.
+    Updates a WSOL token account's recorded balance to match the lamports it
+    actually holds, so plain transfers can fund it.
     
     Args:
-        account: The account to close
-        destination: Where to send the remaining lamports
-        owner: The account owner (must sign)
+        account: The WSOL token account to sync
         
     Returns:
-        Instruction for closing the account
+        Instruction for syncing the native balance
     """
     accounts = [
         AccountMeta(pubkey=account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=destination, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=owner, is_signer=True, is_writable=False),
     ]
     
-    data = bytes([9])
-    
     return Instruction(
         program_id=TOKEN_PROGRAM_ID,
-        data=data,
+        data=SYNC_NATIVE_INSTRUCTION_DATA,
         accounts=accounts
     )
 
 
-def create_wsol_account_with_seed(payer: Pubkey, seed: str, lamports: int) -> tuple[Pubkey, Instruction, Instruction]:
-    """
-    Create a WSOL account using createAccountWithSeed and initialize it.
-    
-    This replicates the exact pattern from the Solscan example where a new account
-    is created with a seed and then initialized as a token account.
-    
-    Args:
-        payer: The account that will pay for and own the new account
-        seed: String seed for deterministic account generation
-        lamports: Amount of lamports to transfer to the new account
-        
-    Returns:
-        Tuple of (new_account_pubkey, create_instruction, initialize_instruction)
-    """
-    new_account = Pubkey.create_with_seed(payer, seed, TOKEN_PROGRAM_ID)
-
-    create_ix = create_account_with_seed(
-        CreateAccountWithSeedParams(
-            from_pubkey=payer,
-            to_pubkey=new_account,
-            base=payer,
-            seed=seed,
-            lamports=lamports,
-            space=165,  # Size of a token account
-            owner=TOKEN_PROGRAM_ID
-        )
-    )
-    
-    initialize_ix = create_initialize_account_instruction(new_account, WSOL_MINT, payer)
-    
-    return new_account, create_ix, initialize_ix
-
-
 def get_user_base_token_account(payer: Pubkey, base_mint: Pubkey) -> Pubkey:
     """
     Get the user's associated token account for the base token.
@@ -403,14 +404,17 @@ async def buy_exact_in(
     """
     Execute a buy_exact_in transaction on Raydium LaunchLab.
     
-    This function implements the exact transaction flow from the Solscan example:
+    Transaction flow:
     1. SetComputeUnitPrice
     2. SetComputeUnitLimit
     3. Create Associated Token Account for base token (idempotent)
-    4. Create WSOL account with seed
-    5. Initialize WSOL account
-    6. Execute buy_exact_in instruction
-    7. Close WSOL account
+    4. Create WSOL Associated Token Account (idempotent)
+    5. Transfer the swap amount into the WSOL account
+    6. SyncNative to update its recorded balance
+    7. Execute buy_exact_in instruction
+    
+    The WSOL ATA persists between buys; it is funded per swap rather than
+    created and closed each time.
     
     Args:
         client: Solana RPC client
@@ -428,25 +432,45 @@ async def buy_exact_in(
             print("Pool state not found for this token")
             return None
             
-        # Get and decode pool state data using IDL parser
-        pool_state_data = await get_pool_state_data(client, pool_state)
+        # Batch the account reads (pool state + payer balance) into a single
+        # getMultipleAccounts round-trip and fetch the blockhash in parallel,
+        # cutting two RTTs off the path between quote and send
+        accounts_resp, blockhash_resp = await asyncio.gather(
+            client.get_multiple_accounts([pool_state, PAYER_PUBKEY]),
+            client.get_latest_blockhash(),
+        )
+        pool_account, payer_account = accounts_resp.value
+        if pool_account is None:
+            print("Pool state account not found")
+            return None
+
+        balance_sol = (payer_account.lamports if payer_account else 0) / LAMPORTS_PER_SOL
+        print(f"Wallet balance: {balance_sol:.6f} SOL")
+        if balance_sol < amount_in_sol + 0.001:  # Include some buffer for fees
+            print("Insufficient SOL balance!")
+            return None
+
+        pool_state_data = decode_pool_state(pool_account.data)
         if not pool_state_data:
             print("Failed to decode pool state data")
             return None
         
-        # Extract vault addresses from decoded pool state (convert from base58 strings to Pubkey objects)
-        base_vault = Pubkey.from_string(pool_state_data["base_vault"])
-        quote_vault = Pubkey.from_string(pool_state_data["quote_vault"])
+        # Extract vault addresses straight from the raw account bytes; going
+        # through the decoded dict would base58-encode and re-parse them
+        vaults = _POOL_VAULTS_CACHE.get(pool_state)
+        if vaults is None:
+            base_vault_bytes, quote_vault_bytes = _POOL_VAULTS_STRUCT.unpack_from(
+                pool_account.data, POOL_VAULTS_OFFSET
+            )
+            vaults = (Pubkey.from_bytes(base_vault_bytes), Pubkey.from_bytes(quote_vault_bytes))
+            _POOL_VAULTS_CACHE[pool_state] = vaults
+        base_vault, quote_vault = vaults
         
         print(f"Found pool state: {pool_state}")
         print(f"Base vault: {base_vault}")
         print(f"Quote vault: {quote_vault}")
         print(f"Pool status: {pool_state_data['status']}")
         
-        # Derive necessary PDAs
-        authority = derive_authority_pda()
-        event_authority = derive_event_authority_pda()
-        
         # Calculate amounts using pool state data
         amount_in = int(amount_in_sol * LAMPORTS_PER_SOL)
         minimum_amount_out = calculate_minimum_amount_out_from_pool_state(
@@ -456,59 +480,73 @@ async def buy_exact_in(
         print(f"Amount in: {amount_in} lamports ({amount_in_sol} SOL)")
         print(f"Minimum amount out: {minimum_amount_out}")
         
-        # Step 1: Create Associated Token Account for base token (idempotent)
-        user_base_token = get_associated_token_address(PAYER.pubkey(), base_token_mint)
-        create_ata_ix = create_associated_token_account_idempotent_instruction(
-            PAYER.pubkey(),
-            PAYER.pubkey(),
-            base_token_mint
-        )
-        
-        # Step 2: Create WSOL account with seed
-        import hashlib
-        import time
-        # Generate a unique seed based on timestamp and user pubkey
-        seed_data = f"{int(time.time())}{str(PAYER.pubkey())}"
-        wsol_seed = hashlib.sha256(seed_data.encode()).hexdigest()[:32]
-        
-        # Calculate required lamports (amount + small buffer for account creation)
-        account_creation_lamports = 2_039_280  # Standard account creation cost
-        total_lamports = amount_in + account_creation_lamports
-        
-        user_quote_token, create_wsol_ix, init_wsol_ix = create_wsol_account_with_seed(
-            PAYER.pubkey(),
-            wsol_seed,
-            total_lamports
+        # Steps 1-3: everything below is fixed for a given mint, so it is
+        # built on the first buy and replayed from the template afterwards.
+        # Re-encoding the message from these cached objects goes through
+        # solders' Rust-native encoder, which is both cheaper and safer than
+        # patching amount bytes into a serialized message by offset
+        template = _BUY_TEMPLATE_CACHE.get(base_token_mint)
+        if template is None:
+            # Step 1: Create Associated Token Account for base token (idempotent)
+            user_base_token = get_associated_token_address(PAYER_PUBKEY, base_token_mint)
+            create_ata_ix = create_associated_token_account_idempotent_instruction(
+                PAYER_PUBKEY,
+                PAYER_PUBKEY,
+                base_token_mint
+            )
+            
+            # Step 2: Fund the payer's persistent WSOL ATA. Compared to the
+            # create-with-seed pattern this drops a SHA-256 seed derivation, an
+            # InitializeAccount CPI, and the close instruction from every buy
+            user_quote_token = get_associated_token_address(PAYER_PUBKEY, WSOL_MINT)
+            create_wsol_ata_ix = create_associated_token_account_idempotent_instruction(
+                PAYER_PUBKEY,
+                PAYER_PUBKEY,
+                WSOL_MINT
+            )
+            sync_wsol_ix = create_sync_native_instruction(user_quote_token)
+            
+            print(f"User base token account: {user_base_token}")
+            print(f"User quote token account: {user_quote_token}")
+            
+            # Step 3: Build the buy_exact_in account list
+            accounts = [
+                _PAYER_META,                                                                   # payer
+                _AUTHORITY_META,                                                               # authority
+                _GLOBAL_CONFIG_META,                                                           # global_config
+                _PLATFORM_CONFIG_META,                                                         # platform_config
+                AccountMeta(pubkey=pool_state, is_signer=False, is_writable=True),             # pool_state
+                AccountMeta(pubkey=user_base_token, is_signer=False, is_writable=True),        # user_base_token
+                AccountMeta(pubkey=user_quote_token, is_signer=False, is_writable=True),       # user_quote_token
+                AccountMeta(pubkey=base_vault, is_signer=False, is_writable=True),             # base_vault
+                AccountMeta(pubkey=quote_vault, is_signer=False, is_writable=True),            # quote_vault
+                AccountMeta(pubkey=base_token_mint, is_signer=False, is_writable=False),       # base_token_mint
+                _WSOL_MINT_META,                                                               # quote_token_mint
+                _TOKEN_PROGRAM_META,                                                           # base_token_program
+                _TOKEN_PROGRAM_META,                                                           # quote_token_program
+                _EVENT_AUTHORITY_META,                                                         # event_authority
+                _LAUNCHLAB_PROGRAM_META,                                                       # program
+            ]
+            template = (accounts, create_ata_ix, create_wsol_ata_ix, sync_wsol_ix, user_quote_token)
+            _BUY_TEMPLATE_CACHE[base_token_mint] = template
+        
+        accounts, create_ata_ix, create_wsol_ata_ix, sync_wsol_ix, user_quote_token = template
+        
+        # The funding transfer carries amount_in, so it is rebuilt per buy
+        fund_wsol_ix = transfer(
+            TransferParams(
+                from_pubkey=PAYER_PUBKEY,
+                to_pubkey=user_quote_token,
+                lamports=amount_in
+            )
         )
         
-        print(f"User base token account: {user_base_token}")
-        print(f"User quote token account: {user_quote_token}")
-        
-        # Step 3: Build the buy_exact_in instruction
-        accounts = [
-            AccountMeta(pubkey=PAYER.pubkey(), is_signer=True, is_writable=True),          # payer
-            AccountMeta(pubkey=authority, is_signer=False, is_writable=False),             # authority
-            AccountMeta(pubkey=GLOBAL_CONFIG, is_signer=False, is_writable=False),         # global_config
-            AccountMeta(pubkey=LETSBONK_PLATFORM_CONFIG, is_signer=False, is_writable=False),  # platform_config
-            AccountMeta(pubkey=pool_state, is_signer=False, is_writable=True),             # pool_state
-            AccountMeta(pubkey=user_base_token, is_signer=False, is_writable=True),        # user_base_token
-            AccountMeta(pubkey=user_quote_token, is_signer=False, is_writable=True),       # user_quote_token
-            AccountMeta(pubkey=base_vault, is_signer=False, is_writable=True),             # base_vault
-            AccountMeta(pubkey=quote_vault, is_signer=False, is_writable=True),            # quote_vault
-            AccountMeta(pubkey=base_token_mint, is_signer=False, is_writable=False),       # base_token_mint
-            AccountMeta(pubkey=WSOL_MINT, is_signer=False, is_writable=False),             # quote_token_mint
-            AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),      # base_token_program
-            AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),      # quote_token_program
-            AccountMeta(pubkey=event_authority, is_signer=False, is_writable=False),       # event_authority
-            AccountMeta(pubkey=RAYDIUM_LAUNCHLAB_PROGRAM_ID, is_signer=False, is_writable=False),  # program
-        ]
-        
         # Instruction data: discriminator + amount_in + minimum_amount_out + share_fee_rate
-        instruction_data = (
-            BUY_EXACT_IN_DISCRIMINATOR +
-            struct.pack("<Q", amount_in) +           # amount_in (u64)
-            struct.pack("<Q", minimum_amount_out) +  # minimum_amount_out (u64)
-            struct.pack("<Q", SHARE_FEE_RATE)        # share_fee_rate (u64): 0
+        instruction_data = _BUY_EXACT_IN_STRUCT.pack(
+            BUY_EXACT_IN_DISCRIMINATOR,
+            amount_in,           # amount_in (u64)
+            minimum_amount_out,  # minimum_amount_out (u64)
+            SHARE_FEE_RATE       # share_fee_rate (u64): 0
         )
         
         buy_exact_in_ix = Instruction(
@@ -517,44 +555,44 @@ async def buy_exact_in(
             accounts=accounts
         )
         
-        # Step 4: Create close WSOL account instruction
-        close_wsol_ix = create_close_account_instruction(user_quote_token, PAYER.pubkey(), PAYER.pubkey())
-        
-        # Step 5: Build complete transaction
+        # Step 4: Build complete transaction
         instructions = [
             set_compute_unit_price(COMPUTE_UNIT_PRICE),
             set_compute_unit_limit(COMPUTE_UNIT_LIMIT),
             # Instruction #3: Create Associated Token Account for base token (idempotent)
             create_ata_ix,
-            # Instruction #4: Create WSOL account with seed
-            create_wsol_ix,
-            # Instruction #5: Initialize WSOL account
-            init_wsol_ix,
-            # Instruction #6: Execute buy_exact_in
-            buy_exact_in_ix,
-            # Instruction #7: Close WSOL account
-            close_wsol_ix
+            # Instruction #4: Create WSOL Associated Token Account (idempotent)
+            create_wsol_ata_ix,
+            # Instruction #5: Fund the WSOL account with the swap amount
+            fund_wsol_ix,
+            # Instruction #6: Sync the WSOL balance
+            sync_wsol_ix,
+            # Instruction #7: Execute buy_exact_in
+            buy_exact_in_ix
         ]
         
-        blockhash_resp = await client.get_latest_blockhash()
+        # Blockhash was prefetched alongside the account reads above
         recent_blockhash = blockhash_resp.value.blockhash
         
         message = Message.new_with_blockhash(
             instructions,
-            PAYER.pubkey(),
+            PAYER_PUBKEY,
             recent_blockhash
         )
         
         transaction = VersionedTransaction(message, [PAYER])
         
-        print("Simulating transaction...")
-        simulation = await client.simulate_transaction(transaction)
-        
-        if simulation.value.err:
-            print(f"Simulation failed: {simulation.value.err}")
-            return None
-        
-        print(f"Simulation successful. Compute units consumed: {simulation.value.units_consumed}")
+        # Simulation duplicates the work the validator does anyway and adds a
+        # full RPC round-trip per buy; keep it available for debugging only
+        if DEBUG_SIMULATE:
+            print("Simulating transaction...")
+            simulation = await client.simulate_transaction(transaction)
+            
+            if simulation.value.err:
+                print(f"Simulation failed: {simulation.value.err}")
+                return None
+            
+            print(f"Simulation successful. Compute units consumed: {simulation.value.units_consumed}")
 
         print("Sending transaction...")
         result = await client.send_transaction(
@@ -565,9 +603,11 @@ async def buy_exact_in(
         tx_signature = result.value
         print(f"Transaction sent: https://solscan.io/tx/{tx_signature}")
         
-        print("Waiting for confirmation...")
-        await client.confirm_transaction(tx_signature, commitment="confirmed")
-        print("Transaction confirmed!")
+        # Blocking on confirmation serializes buys; skip it unless asked to
+        if WAIT_FOR_CONFIRMATION:
+            print("Waiting for confirmation...")
+            await client.confirm_transaction(tx_signature, commitment="confirmed")
+            print("Transaction confirmed!")
         
         return tx_signature
         
@@ -592,14 +632,8 @@ async def main():
         print()
         
         async with AsyncClient(RPC_ENDPOINT) as client:
-            balance_resp = await client.get_balance(PAYER.pubkey())
-            balance_sol = balance_resp.value / LAMPORTS_PER_SOL
-            print(f"Wallet balance: {balance_sol:.6f} SOL")
-            
-            if balance_sol < SOL_AMOUNT_TO_SPEND + 0.001:  # Include some buffer for fees
-                print("Insufficient SOL balance!")
-                return
-            
+            # Balance is checked inside buy_exact_in from the same batched
+            # account read that fetches the pool state - no separate RTT
             tx_signature = await buy_exact_in(client, TOKEN_MINT_ADDRESS, SOL_AMOUNT_TO_SPEND, SLIPPAGE_TOLERANCE)
             
             if tx_signature:
@@ -618,5 +652,14 @@ async def main():
         sys.exit(1)
 
 
+try:
+    # Optional on Linux: uvloop's event loop roughly halves socket and timer
+    # overhead versus the default asyncio loop
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Monitors Raydium LaunchLab pool migrations to Raydium CPMM (CPSwap) using
+WebSocket logsSubscribe.
+Watches LaunchLab program logs for the MigrateToCpswap instruction, then
+fetches the full transaction to extract the migrated pool's accounts.
+Requires a Solana RPC WebSocket endpoint for access.
+"""
+
+import asyncio
+import json
+import os
+
+import websockets
+from dotenv import load_dotenv
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+try:
+    # Optional Rust-backed JSON parser; several times faster than stdlib json
+    # on the log-heavy notification payloads Raydium emits
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+load_dotenv()
+
+WSS_ENDPOINT = os.getenv("SOLANA_NODE_WSS_ENDPOINT")
+RPC_ENDPOINT = os.getenv("SOLANA_NODE_RPC_ENDPOINT")
+
+# LetsBonk related program IDs
+RAYDIUM_LAUNCHLAB_ID = Pubkey.from_string("LanMV9sAd7wArD4vJFi2qDdfnVhFxYSUg6eADduJ3uj")
+RAYDIUM_LAUNCHLAB_STR = str(RAYDIUM_LAUNCHLAB_ID)
+
+# Log line emitted by the LaunchLab program when a pool migrates to CPSwap
+MIGRATE_TO_CPSWAP_LOG = "Program log: Instruction: MigrateToCpswap"
+
+# 8-byte Anchor discriminator of migrate_to_cpswap (from the IDL)
+MIGRATE_TO_CPSWAP_DISCRIMINATOR = bytes([136, 92, 200, 103, 28, 218, 144, 140])
+
+# Account positions of interest in the migrate_to_cpswap instruction (from the
+# IDL): index 17 is the LaunchLab pool being migrated, 5 is the new CPSwap pool
+MIGRATE_ACCOUNT_INDEXES = {
+    "base_mint": 1,
+    "cpswap_pool": 5,
+    "cpswap_lp_mint": 7,
+    "pool_state": 17,
+}
+
+# Cap on concurrent get_transaction fetches; bursts beyond this queue on the
+# semaphore instead of flooding the RPC node into 429s
+MAX_CONCURRENT_FETCHES = 16
+
+# The subscription request never changes; encode it once at import so
+# reconnects just send the frozen frame
+SUBSCRIPTION_MESSAGE = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "logsSubscribe",
+    "params": [
+        {"mentions": [RAYDIUM_LAUNCHLAB_STR]},
+        {"commitment": "confirmed"},
+    ],
+}).encode()
+
+# Backoff schedule while waiting for the node to index a confirmed
+# transaction: 0.25s, 0.5s, 1s, 2s, 4s (about 8s total before giving up)
+FETCH_ATTEMPTS = 5
+FETCH_INITIAL_DELAY = 0.25
+FETCH_MAX_DELAY = 4.0
+
+
+async def process_transaction(client: AsyncClient, signature: str, semaphore: asyncio.Semaphore):
+    """Fetch a migration transaction and print the migrated pool details."""
+    async with semaphore:
+        return await _fetch_and_print(client, signature)
+
+
+async def _fetch_and_print(client: AsyncClient, signature: str):
+    sig = Signature.from_string(signature)
+    # base64 returns the raw compiled transaction: the node skips the
+    # server-side instruction decoding jsonParsed forces, and the payload is
+    # a fraction of the size on the wire
+    # Poll with exponential backoff: the node usually indexes a confirmed
+    # transaction within a second, so start fast instead of sleeping a fixed 5s
+    delay = FETCH_INITIAL_DELAY
+    for attempt in range(FETCH_ATTEMPTS):
+        resp = await client.get_transaction(
+            sig,
+            encoding="base64",
+            commitment="confirmed",
+            max_supported_transaction_version=0,
+        )
+        if resp.value is not None:
+            break
+        if attempt < FETCH_ATTEMPTS - 1:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, FETCH_MAX_DELAY)
+    if resp.value is None:
+        print(f"⚠️  Transaction not found: {signature}")
+        return
+
+    message = resp.value.transaction.transaction.message
+    account_keys = message.account_keys
+    n_keys = len(account_keys)
+    for ix in message.instructions:
+        if account_keys[ix.program_id_index] != RAYDIUM_LAUNCHLAB_ID:
+            continue
+        if not ix.data.startswith(MIGRATE_TO_CPSWAP_DISCRIMINATOR):
+            continue
+        accounts = ix.accounts
+
+        print("\n🔄 POOL MIGRATED TO CPSWAP")
+        print(f"   Signature: {signature}")
+        for name, index in MIGRATE_ACCOUNT_INDEXES.items():
+            if index < len(accounts) and accounts[index] < n_keys:
+                print(f"   {name}: {account_keys[accounts[index]]}")
+        print("   " + "=" * 60)
+
+
+async def listen_for_migrations():
+    """Monitor Solana blockchain for LetsBonk pool migrations to CPSwap."""
+    print("Starting LetsBonk CPSwap migration monitor using logsSubscribe")
+    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_STR}")
+    print(f"Connecting to: {WSS_ENDPOINT}")
+
+    # One persistent RPC client for all transaction fetches: connection reuse
+    # avoids a TCP+TLS handshake per migration and bounds socket usage
+    async with AsyncClient(RPC_ENDPOINT) as client:
+        fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        # Hold strong references to in-flight fetch tasks; done tasks remove
+        # themselves so the set stays bounded
+        pending_fetches: set = set()
+
+        # Raydium log frames are repetitive JSON that deflates well; raise
+        # max_size so notification bursts are not truncated at the default
+        # 1 MiB, and let the library's ping/pong detect dead connections
+        async with websockets.connect(
+            WSS_ENDPOINT,
+            compression="deflate",
+            max_size=2**23,
+            ping_interval=20,
+            ping_timeout=10,
+            close_timeout=5,
+        ) as websocket:
+            await websocket.send(SUBSCRIPTION_MESSAGE)
+            print(f"Subscribed to logs mentioning program: {RAYDIUM_LAUNCHLAB_STR}")
+
+            while True:
+                try:
+                    response = await websocket.recv()
+                    data = _json_loads(response)
+
+                    if data.get("method") != "logsNotification":
+                        if "result" in data:
+                            print("Subscription confirmed")
+                        continue
+
+                    value = data["params"]["result"]["value"]
+                    # Skip failed transactions
+                    if value.get("err") is not None:
+                        continue
+                    # List membership runs the string comparisons in C; the
+                    # generator version re-enters the interpreter per log line
+                    logs = value.get("logs", [])
+                    if MIGRATE_TO_CPSWAP_LOG not in logs:
+                        continue
+
+                    signature = value["signature"]
+                    print(f"Migration detected: {signature}")
+                    # Fetch the transaction without blocking the receive loop
+                    task = asyncio.create_task(
+                        process_transaction(client, signature, fetch_semaphore)
+                    )
+                    pending_fetches.add(task)
+                    task.add_done_callback(pending_fetches.discard)
+
+                except websockets.exceptions.ConnectionClosed:
+                    print("WebSocket connection closed. Reconnecting...")
+                    break
+                except Exception as e:
+                    print(f"An error occurred: {e}")
+
+    print("WebSocket connection closed.")
+
+
+try:
+    # Optional on Linux: uvloop's event loop roughly halves socket and timer
+    # overhead versus the default asyncio loop
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+if __name__ == "__main__":
+    asyncio.run(listen_for_migrations())
@@ -14,7 +14,8 @@ import base64
 import json
 import os
 import struct
-from typing import Dict, Any
+import sys
+from typing import NamedTuple
 
 import base58
 import websockets
@@ -22,6 +23,22 @@ from dotenv import load_dotenv
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 
+try:
+    # Optional SIMD-accelerated base64 (libbase64 with AVX2/SSSE3 dispatch);
+    # blocks carry hundreds of base64 transactions, stdlib decodes them scalar
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    _b64decode = base64.b64decode
+
+try:
+    # Optional Rust-backed JSON parser; block notifications run to megabytes
+    # and orjson parses them several times faster than stdlib json, straight
+    # from the bytes of the websocket frame
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
 WSS_ENDPOINT = os.getenv("SOLANA_NODE_WSS_ENDPOINT")
@@ -30,245 +47,398 @@ WSS_ENDPOINT = os.getenv("SOLANA_NODE_WSS_ENDPOINT")
 RAYDIUM_LAUNCHLAB_ID = Pubkey.from_string("LanMV9sAd7wArD4vJFi2qDdfnVhFxYSUg6eADduJ3uj")
 LETSBONK_PLATFORM_CONFIG_ID = Pubkey.from_string("FfYek5vEz23cMkWsdJwG2oa6EphsvXSHrGpdALN4g6W1")
 
+# Precomputed forms of the program IDs: raw 32 bytes for scanning wire
+# transaction buffers, base58 strings for the subscription request and prints
+RAYDIUM_LAUNCHLAB_BYTES = bytes(RAYDIUM_LAUNCHLAB_ID)
+LETSBONK_PLATFORM_CONFIG_BYTES = bytes(LETSBONK_PLATFORM_CONFIG_ID)
+RAYDIUM_LAUNCHLAB_STR = str(RAYDIUM_LAUNCHLAB_ID)
+LETSBONK_PLATFORM_CONFIG_STR = str(LETSBONK_PLATFORM_CONFIG_ID)
+
 # Initialize instruction discriminator from IDL (same as geyser_basic.py)
 INITIALIZE_DISCRIMINATOR = bytes([175, 175, 109, 31, 13, 152, 155, 237])
-INITIALIZE_DISCRIMINATOR_U64 = struct.unpack("<Q", INITIALIZE_DISCRIMINATOR)[0]
+
+# Bounded hand-off between the websocket reader and the decode workers; block
+# notifications are large, so the queue stays small
+NOTIFICATION_QUEUE_SIZE = 64
+NUM_DECODE_WORKERS = 4
+
+# Reconnect backoff: 1s doubling to a 30s cap, reset once a connection holds
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Precompiled field readers: struct.unpack_from with a literal format string
+# re-parses the format on every call, Struct objects compile it once
+_U32 = struct.Struct("<I")
+
+# Curve payload plus vesting tail in one unpack per variant: ConstantCurve is
+# supply/total_base_sell/total_quote_fund_raising/migrate_type while Fixed and
+# Linear drop total_base_sell; the trailing three u64s are VestingParams
+_TAIL_CONSTANT = struct.Struct("<QQQBQQQ")
+_TAIL_FIXED_LINEAR = struct.Struct("<QQBQQQ")
 
 
-def decode_create_instruction(ix_data: bytes, keys, accounts) -> dict:
+class TokenInfo(NamedTuple):
+    """Decoded initialize instruction: MintParams fields followed by the
+    instruction accounts in IDL order. A fixed-shape NamedTuple skips the
+    per-token dict allocation and string-key hashing of the old dict result."""
+    name: str
+    symbol: str
+    uri: str
+    decimals: int
+    total_locked_amount: int
+    cliff_period: int
+    unlock_period: int
+    curve_variant: int
+    payer: str
+    creator: str
+    global_config: str
+    platform_config: str
+    authority: str
+    pool_state: str
+    base_mint: str
+    quote_mint: str
+    base_vault: str
+    quote_vault: str
+    metadata_account: str
+    base_token_program: str
+    quote_token_program: str
+    metadata_program: str
+    system_program: str
+    rent_program: str
+
+
+def decode_create_instruction(ix_data: bytes, keys, accounts) -> TokenInfo:
     """Decode a create instruction from transaction data based on IDL structure."""
     # Skip past the 8-byte discriminator prefix
     offset = 8
     
-    # Extract account keys in base58 format
-    def get_account_key(index):
-        if index >= len(accounts):
-            return "N/A"
-        account_index = accounts[index]
-        if account_index >= len(keys):
-            return "N/A"
-        return str(keys[account_index])
+    # Resolve the 16 account slots in one comprehension instead of a closure
+    # call (with two bounds checks) per field
+    n_keys = len(keys)
+    n_accounts = len(accounts)
+    slots = [str(keys[accounts[i]]) if i < n_accounts and accounts[i] < n_keys else "N/A"
+             for i in range(16)]
+    
+    # Parse base_mint_param (MintParams struct) inline: the closure-based
+    # readers this replaces cost a call frame and a nonlocal cell write per
+    # field, which dominates a parse this small
+    data_len = len(ix_data)
+    if offset >= data_len:
+        raise ValueError(f"Not enough data for u8 at offset {offset}")
+    decimals = ix_data[offset]
+    offset += 1
     
-    # Read string fields (prefixed with length)
-    def read_string():
-        nonlocal offset
-        if offset + 4 > len(ix_data):
+    fields = []
+    for _ in range(3):  # name, symbol, uri (length-prefixed strings)
+        if offset + 4 > data_len:
             raise ValueError(f"Not enough data for string length at offset {offset}")
-        # Get string length (4-byte uint)
-        length = struct.unpack_from("<I", ix_data, offset)[0]
+        length = _U32.unpack_from(ix_data, offset)[0]
         offset += 4
-        if offset + length > len(ix_data):
+        end = offset + length
+        if end > data_len:
             raise ValueError(f"Not enough data for string of length {length} at offset {offset}")
-        # Extract and decode the string
-        value = ix_data[offset:offset + length].decode()
-        offset += length
-        return value
-    
-    def read_u8():
-        nonlocal offset
-        if offset + 1 > len(ix_data):
-            raise ValueError(f"Not enough data for u8 at offset {offset}")
-        value = struct.unpack_from("<B", ix_data, offset)[0]
-        offset += 1
-        return value
-    
-    def read_u64():
-        nonlocal offset
-        if offset + 8 > len(ix_data):
-            raise ValueError(f"Not enough data for u64 at offset {offset}")
-        value = struct.unpack_from("<Q", ix_data, offset)[0]
-        offset += 8
-        return value
-    
-    # Parse base_mint_param (MintParams struct)
-    decimals = read_u8()
-    name = read_string()
-    symbol = read_string()
-    uri = read_string()
+        fields.append(ix_data[offset:end].decode())
+        offset = end
+    name, symbol, uri = fields
     
     # Parse curve_param (CurveParams enum)
-    curve_variant = read_u8()  # enum discriminator
+    if offset >= data_len:
+        raise ValueError(f"Not enough data for u8 at offset {offset}")
+    curve_variant = ix_data[offset]  # enum discriminator
+    offset += 1
     
-    # Skip curve data based on variant
+    # Unpack the curve payload and vesting_param (VestingParams) in a single
+    # call per variant; the skipped curve fields come out of the same tuple
     if curve_variant == 0:  # Constant
-        # ConstantCurve: supply(u64), total_base_sell(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 8 + 1  # 25 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for ConstantCurve at offset {offset}")
-        offset += skip_bytes
-    elif curve_variant == 1:  # Fixed
-        # FixedCurve: supply(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 1  # 17 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for FixedCurve at offset {offset}")
-        offset += skip_bytes
-    elif curve_variant == 2:  # Linear
-        # LinearCurve: supply(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 1  # 17 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for LinearCurve at offset {offset}")
-        offset += skip_bytes
+        tail = _TAIL_CONSTANT
+    elif curve_variant == 1 or curve_variant == 2:  # Fixed / Linear
+        tail = _TAIL_FIXED_LINEAR
     else:
         # Unknown variant, try to continue but might fail
         raise ValueError(f"Unknown curve variant: {curve_variant}")
+    if offset + tail.size > len(ix_data):
+        raise ValueError(f"Not enough data for curve variant {curve_variant} at offset {offset}")
+    total_locked_amount, cliff_period, unlock_period = tail.unpack_from(ix_data, offset)[-3:]
+    offset += tail.size
     
-    # Parse vesting_param (VestingParams struct)
-    total_locked_amount = read_u64()
-    cliff_period = read_u64()
-    unlock_period = read_u64()
-    
-    token_info = {
-        "name": name,
-        "symbol": symbol,
-        "uri": uri,
-        "decimals": decimals,
-        "total_locked_amount": total_locked_amount,
-        "cliff_period": cliff_period,
-        "unlock_period": unlock_period,
-        "curve_variant": curve_variant,
-        # Account mappings based on IDL
-        "payer": get_account_key(0),
-        "creator": get_account_key(1),
-        "global_config": get_account_key(2),
-        "platform_config": get_account_key(3),
-        "authority": get_account_key(4),
-        "pool_state": get_account_key(5),
-        "base_mint": get_account_key(6),
-        "quote_mint": get_account_key(7),
-        "base_vault": get_account_key(8),
-        "quote_vault": get_account_key(9),
-        "metadata_account": get_account_key(10),
-        "base_token_program": get_account_key(11),
-        "quote_token_program": get_account_key(12),
-        "metadata_program": get_account_key(13),
-        "system_program": get_account_key(14),
-        "rent_program": get_account_key(15),
-    }
-        
-    return token_info
+    # The 16 slots land positionally after the MintParams/vesting fields;
+    # slot order matches the IDL account order baked into TokenInfo
+    return TokenInfo(name, symbol, uri, decimals, total_locked_amount,
+                     cliff_period, unlock_period, curve_variant, *slots)
+
+
+def format_token_info(token_info: TokenInfo, signature: str) -> str:
+    """Render the token announcement as one pre-formatted block."""
+    lines = [
+        f"\n🚀 NEW TOKEN: {token_info.name} ({token_info.symbol})",
+        f"   Signature: {signature}",
+        f"   Creator: {token_info.creator}",
+        f"   Base Mint: {token_info.base_mint}",
+        f"   Pool State: {token_info.pool_state}",
+        f"   Metadata: {token_info.metadata_account}",
+    ]
+    if token_info.uri:
+        lines.append(f"   Metadata URI: {token_info.uri}")
+    lines.append("   " + "=" * 60)
+    return "\n".join(lines) + "\n"
+
+
+# Filled in by monitor_letsbonk_blocks: token announcements are queued here
+# and flushed by a single writer task, so the decode workers never block on a
+# synchronous stdout write
+_out_queue = None
+
+
+def _emit(text: str):
+    if _out_queue is not None:
+        _out_queue.put_nowait(text)
+    else:
+        print(text, end="")
+
+
+async def _output_writer():
+    """Drain queued announcements and write each batch in one syscall."""
+    buf = []
+    while True:
+        buf.append(await _out_queue.get())
+        # Grab whatever else arrived in the meantime so a burst of launches
+        # becomes one write instead of one per token
+        try:
+            while True:
+                buf.append(_out_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        buf.clear()
+
+
+def _read_compact_u16(raw: bytes, offset: int):
+    """Read a compact-u16 length prefix, returning (value, next_offset)."""
+    byte = raw[offset]
+    value = byte & 0x7F
+    if byte & 0x80:
+        byte = raw[offset + 1]
+        value |= (byte & 0x7F) << 7
+        if byte & 0x80:
+            value |= (raw[offset + 2] & 0x03) << 14
+            return value, offset + 3
+        return value, offset + 2
+    return value, offset + 1
 
 
-def print_token_info(token_info: Dict[str, Any], signature: str):
-    """Print formatted token information in a compact format."""
-    print(f"\n🚀 NEW TOKEN: {token_info.get('name', 'N/A')} ({token_info.get('symbol', 'N/A')})")
-    print(f"   Signature: {signature}")
-    print(f"   Creator: {token_info.get('creator', 'N/A')}")
-    print(f"   Base Mint: {token_info.get('base_mint', 'N/A')}")
-    print(f"   Pool State: {token_info.get('pool_state', 'N/A')}")
-    print(f"   Metadata: {token_info.get('metadata_account', 'N/A')}")
-    if token_info.get('uri'):
-        print(f"   Metadata URI: {token_info['uri']}")
-    print("   " + "="*60)
+def has_required_keys_raw(raw: bytes) -> bool:
+    """Cheap reject-path filter over the wire bytes of a transaction.
+
+    Walks just far enough into the layout (signature count, signatures,
+    version prefix, message header) to locate the static account-keys section
+    and scans it for both required program ids with bytes.find. Most
+    transactions in a Raydium-mentioning block fail this test, so the full
+    VersionedTransaction deserialization only runs for real candidates. A
+    false positive (pattern straddling two keys) is harmless - the decoded
+    path re-checks the account list properly.
+    """
+    try:
+        num_sigs, offset = _read_compact_u16(raw, 0)
+        offset += 64 * num_sigs
+        if raw[offset] & 0x80:  # versioned message prefix byte
+            offset += 1
+        offset += 3  # message header: three u8 counts
+        num_keys, offset = _read_compact_u16(raw, offset)
+        keys_end = offset + 32 * num_keys
+        if keys_end > len(raw):
+            return False
+        return (raw.find(RAYDIUM_LAUNCHLAB_BYTES, offset, keys_end) >= 0
+                and raw.find(LETSBONK_PLATFORM_CONFIG_BYTES, offset, keys_end) >= 0)
+    except IndexError:
+        return False
 
 
 def has_letsbonk_accounts(account_keys: list) -> bool:
     """Check if transaction contains both required LetsBonk accounts."""
-    account_set = set(str(key) for key in account_keys)
-    return (str(RAYDIUM_LAUNCHLAB_ID) in account_set and 
-            str(LETSBONK_PLATFORM_CONFIG_ID) in account_set)
+    # Compare Pubkey objects directly (32-byte equality in native code) instead of
+    # base58-encoding every key in the transaction just to do a membership check.
+    return (RAYDIUM_LAUNCHLAB_ID in account_keys and
+            LETSBONK_PLATFORM_CONFIG_ID in account_keys)
+
+
+def process_transaction_entry(tx):
+    """Decode one base64 transaction entry from a block notification and print
+    any token creation it contains."""
+    if not isinstance(tx, dict) or "transaction" not in tx:
+        return
+    
+    # Decode base64 transaction data
+    tx_data_decoded = _b64decode(tx["transaction"][0])
+    
+    # Peek at the raw key section first; the full deserialize below parses
+    # signatures and instructions most txs never need
+    if not has_required_keys_raw(tx_data_decoded):
+        return
+    
+    # Third literal in the prefilter: buys and sells carry both required keys
+    # but never the initialize discriminator, so one C-level substring scan
+    # rejects them before the full parse (alignment does not matter - this is
+    # only a necessary condition, the instruction loop still checks properly)
+    if INITIALIZE_DISCRIMINATOR not in tx_data_decoded:
+        return
+    
+    transaction = VersionedTransaction.from_bytes(tx_data_decoded)
+    account_keys = transaction.message.account_keys
+    
+    # Check if transaction contains both required accounts
+    if not has_letsbonk_accounts(account_keys):
+        return
+    
+    # Encode the signature lazily: plenty of transactions carry both required
+    # accounts (buys, sells) but never reach a print that needs it
+    signature = None
+    
+    def _get_sig():
+        nonlocal signature
+        if signature is None:
+            if tx.get('signature'):
+                signature = tx['signature']
+            else:
+                # Fallback: extract signature from transaction
+                signature = base58.b58encode(bytes(transaction.signatures[0])).decode()
+        return signature
+    
+    # Process instructions
+    for ix in transaction.message.instructions:
+        program_id = account_keys[ix.program_id_index]
+        
+        # Check if instruction is from Raydium LaunchLab
+        # (Pubkey equality is a 32-byte memcmp, no base58)
+        if program_id == RAYDIUM_LAUNCHLAB_ID:
+            ix_data = bytes(ix.data)
+            
+            # Prefix test is a single C-level memcmp: no 8-byte slice, no
+            # struct call (same pattern as geyser_basic.py)
+            if not ix_data.startswith(INITIALIZE_DISCRIMINATOR):
+                continue
+            
+            # Token creation should have substantial data and many accounts
+            if len(ix_data) <= 8 or len(ix.accounts) < 10:
+                print(f"⚠️  Likely non-creation tx (data: {len(ix_data)}B, accounts: {len(ix.accounts)}) | {_get_sig()[:16]}...")
+                continue
+            
+            # Decode the instruction
+            try:
+                token_info = decode_create_instruction(ix_data, account_keys, ix.accounts)
+                _emit(format_token_info(token_info, _get_sig()))
+            except Exception as e:
+                print(f"⚠️  Failed to decode instruction: {e}")
+                print(f"   Signature: {_get_sig()}")
+                print(f"   Data length: {len(ix_data)}, Accounts: {len(ix.accounts)}, Keys: {len(account_keys)}")
+                print("   " + "-"*60)
+
+
+def process_block_notification(data):
+    """Walk a blockNotification payload and decode every transaction in it."""
+    block_data = data.get("params", {}).get("result", {})
+    block = block_data.get("value", {}).get("block")
+    if not block:
+        return
+    for tx in block.get("transactions", ()):
+        process_transaction_entry(tx)
 
 
 async def monitor_letsbonk_blocks():
     """Monitor Solana blockchain for new LetsBonk token creations using blockSubscribe."""
     print("Starting LetsBonk token monitor using WebSocket blockSubscribe")
     print("Monitoring for blocks containing transactions with both:")
-    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_ID}")
-    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_ID}")
+    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_STR}")
+    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_STR}")
     print(f"Connecting to: {WSS_ENDPOINT}")
     
-    async with websockets.connect(WSS_ENDPOINT) as websocket:
-        # Subscribe to blocks mentioning the Raydium LaunchLab program
-        subscription_message = json.dumps({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "blockSubscribe",
-            "params": [
-                {"mentionsAccountOrProgram": str(RAYDIUM_LAUNCHLAB_ID)},
-                {
-                    "commitment": "confirmed",
-                    "encoding": "base64",
-                    "showRewards": False,
-                    "transactionDetails": "full",
-                    "maxSupportedTransactionVersion": 0,
-                },
-            ],
-        })
-        
-        await websocket.send(subscription_message)
-        print(f"Subscribed to blocks mentioning program: {RAYDIUM_LAUNCHLAB_ID}")
-        
-        while True:
-            try:
-                response = await websocket.recv()
-                data = json.loads(response)
+    # Subscribe to blocks mentioning the Raydium LaunchLab program
+    subscription_message = json.dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "blockSubscribe",
+        "params": [
+            {"mentionsAccountOrProgram": RAYDIUM_LAUNCHLAB_STR},
+            {
+                "commitment": "confirmed",
+                "encoding": "base64",
+                "showRewards": False,
+                "transactionDetails": "full",
+                "maxSupportedTransactionVersion": 0,
+            },
+        ],
+    })
+    
+    # Token announcements go through a dedicated writer task so the decode
+    # workers hand off a string instead of blocking on stdout
+    global _out_queue
+    _out_queue = asyncio.Queue()
+    writer_task = asyncio.create_task(_output_writer())  # noqa: F841 - keep a reference
+    
+    # Reconnect forever with exponential backoff: a network blip must not end
+    # the monitor, or launches land unseen while the process sits dead
+    backoff = RECONNECT_INITIAL_DELAY
+    while True:
+        try:
+            # max_size=None: block notifications routinely exceed the 1 MiB
+            # default frame cap; compression=None trades bandwidth for not
+            # inflating megabytes of JSON on the decode loop's CPU
+            async with websockets.connect(
+                WSS_ENDPOINT,
+                max_size=None,
+                compression=None,
+                open_timeout=10,
+            ) as websocket:
+                await websocket.send(subscription_message)
+                print(f"Subscribed to blocks mentioning program: {RAYDIUM_LAUNCHLAB_STR}")
+                backoff = RECONNECT_INITIAL_DELAY
                 
-                if "method" in data and data["method"] == "blockNotification":
-                    if "params" in data and "result" in data["params"]:
-                        block_data = data["params"]["result"]
-                        if "value" in block_data and "block" in block_data["value"]:
-                            block = block_data["value"]["block"]
-                            if "transactions" in block:
-                                for tx in block["transactions"]:
-                                    if isinstance(tx, dict) and "transaction" in tx:
-                                        # Decode base64 transaction data
-                                        tx_data_encoded = tx["transaction"][0]
-                                        tx_data_decoded = base64.b64decode(tx_data_encoded)
-                                        transaction = VersionedTransaction.from_bytes(tx_data_decoded)
-                                        
-                                        # Check if transaction contains both required accounts
-                                        if not has_letsbonk_accounts(transaction.message.account_keys):
-                                            continue
-                                        
-                                        # Get transaction signature
-                                        if hasattr(tx, 'signature') and tx['signature']:
-                                            signature = tx['signature']
-                                        else:
-                                            # Fallback: extract signature from transaction
-                                            signature = base58.b58encode(bytes(transaction.signatures[0])).decode()
-                                        
-                                        # Process instructions
-                                        for ix in transaction.message.instructions:
-                                            program_id = transaction.message.account_keys[ix.program_id_index]
-                                            
-                                            # Check if instruction is from Raydium LaunchLab
-                                            if str(program_id) == str(RAYDIUM_LAUNCHLAB_ID):
-                                                ix_data = bytes(ix.data)
-                                                
-                                                # Check for initialize discriminator
-                                                if len(ix_data) >= 8:
-                                                    discriminator = struct.unpack("<Q", ix_data[:8])[0]
-                                                    
-                                                    if discriminator == INITIALIZE_DISCRIMINATOR_U64:
-                                                        # Token creation should have substantial data and many accounts
-                                                        if len(ix_data) <= 8 or len(ix.accounts) < 10:
-                                                            print(f"⚠️  Likely non-creation tx (data: {len(ix_data)}B, accounts: {len(ix.accounts)}) | {signature[:16]}...")
-                                                            continue
-                                                        
-                                                        # Decode the instruction
-                                                        try:
-                                                            token_info = decode_create_instruction(ix_data, transaction.message.account_keys, ix.accounts)
-                                                            print_token_info(token_info, signature)
-                                                        except Exception as e:
-                                                            print(f"⚠️  Failed to decode instruction: {e}")
-                                                            print(f"   Signature: {signature}")
-                                                            print(f"   Data length: {len(ix_data)}, Accounts: {len(ix.accounts)}, Keys: {len(transaction.message.account_keys)}")
-                                                            print("   " + "-"*60)
+                # Decouple receiving from decoding so a slow block decode never
+                # stalls the websocket read: the reader only enqueues, worker
+                # tasks drain the queue (same shape as the geyser_advanced
+                # pipeline)
+                notification_queue: asyncio.Queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
                 
-                elif "result" in data:
-                    print("Subscription confirmed")
-                else:
-                    print(f"Received unexpected message type: {data.get('method', 'Unknown')}")
-                    
-            except websockets.exceptions.ConnectionClosed:
-                print("WebSocket connection closed. Reconnecting...")
-                break
-            except Exception as e:
-                print(f"An error occurred: {e}")
-                print(f"Error details: {type(e).__name__}")
-                import traceback
-                traceback.print_exc()
-    
-    print("WebSocket connection closed.")
+                async def receive_notifications():
+                    while True:
+                        # decode=False skips the UTF-8 str conversion of the
+                        # text frame; the JSON parser takes bytes directly
+                        response = await websocket.recv(decode=False)
+                        data = _json_loads(response)
+                        if data.get("method") != "blockNotification":
+                            if "result" in data:
+                                print("Subscription confirmed")
+                            else:
+                                print(f"Received unexpected message type: {data.get('method', 'Unknown')}")
+                            continue
+                        try:
+                            notification_queue.put_nowait(data)
+                        except asyncio.QueueFull:
+                            print("⚠️  Notification queue full - dropping block notification")
+                
+                async def decode_worker():
+                    while True:
+                        data = await notification_queue.get()
+                        try:
+                            process_block_notification(data)
+                        except Exception as e:
+                            print(f"An error occurred: {e}")
+                            print(f"Error details: {type(e).__name__}")
+                            import traceback
+                            traceback.print_exc()
+                        notification_queue.task_done()
+                
+                workers = [asyncio.create_task(decode_worker()) for _ in range(NUM_DECODE_WORKERS)]
+                try:
+                    await receive_notifications()
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+        except (websockets.exceptions.ConnectionClosed, OSError) as e:
+            print(f"WebSocket connection lost ({e}). Reconnecting in {backoff:.0f}s...")
+        
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, RECONNECT_MAX_DELAY)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,11 @@ This listener monitors for transactions that include both:
 """
 
 import asyncio
+import logging
+import logging.handlers
 import os
+import queue
+import struct
 from typing import Dict, Any
 import sys
 
@@ -20,23 +24,68 @@ from dotenv import load_dotenv
 from solders.pubkey import Pubkey
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Prefer the native (upb) protobuf backend; the pure-Python fallback is
+# 25-100x slower on deserialization-heavy streams like this one
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
 from generated import geyser_pb2, geyser_pb2_grpc
+from google.protobuf.internal import api_implementation
 from learning_examples_py.idl_parser import load_idl_parser
 
+if api_implementation.Type() == "python":
+    print("⚠️  protobuf is using its pure-Python backend; reinstall protobuf with the native extension for much faster parsing")
+
 
 load_dotenv()
 
+# Route log records through an unbounded queue drained by a background thread,
+# so a slow stdout (e.g. piped to a lagging consumer) never blocks the decode
+# workers; each token event is emitted as a single record/syscall
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 GEYSER_ENDPOINT = os.getenv("GEYSER_ENDPOINT")
 GEYSER_API_TOKEN = os.getenv("GEYSER_API_TOKEN")
 # Default to x-token auth, can be set to "basic"
 AUTH_TYPE = "x-token"
 
+# Bounded hand-off between the gRPC reader and the decode workers
+UPDATE_QUEUE_SIZE = 1024
+NUM_DECODE_WORKERS = 4
+
+# Channel tuning for a long-lived, high-rate stream: larger receive window and
+# message cap, plus keepalive pings so quiet periods don't drop the connection
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 10_000),
+    ("grpc.keepalive_timeout_ms", 5_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10_000),
+    ("grpc.http2.bdp_probe", 1),
+]
+
 # LetsBonk related program IDs
 RAYDIUM_LAUNCHLAB_ID = Pubkey.from_string("LanMV9sAd7wArD4vJFi2qDdfnVhFxYSUg6eADduJ3uj")
 LETSBONK_PLATFORM_CONFIG_ID = Pubkey.from_string("FfYek5vEz23cMkWsdJwG2oa6EphsvXSHrGpdALN4g6W1")
 
-# Initialize instruction discriminator from IDL
-INITIALIZE_DISCRIMINATOR = bytes([175, 175, 109, 31, 13, 152, 155, 237])
+# Precomputed forms of the program IDs: base58 strings for the subscription
+# request, raw 32 bytes for comparisons against the native account_keys payload
+RAYDIUM_LAUNCHLAB_STR = str(RAYDIUM_LAUNCHLAB_ID)
+LETSBONK_PLATFORM_CONFIG_STR = str(LETSBONK_PLATFORM_CONFIG_ID)
+RAYDIUM_LAUNCHLAB_RAW = bytes(RAYDIUM_LAUNCHLAB_ID)
+
+# Reads the 8-byte Anchor discriminator as a single integer for dispatch
+_DISC_U64 = struct.Struct("<Q")
+
+# Accounts that only the initialize path references (from the IDL's fixed
+# accounts): used to tighten the server-side subscription filter
+METAPLEX_METADATA_STR = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+RENT_SYSVAR_STR = "SysvarRent111111111111111111111111111111111"
 
 
 async def create_geyser_connection():
@@ -51,16 +100,21 @@ async def create_geyser_connection():
         )
     
     creds = grpc.composite_channel_credentials(grpc.ssl_channel_credentials(), auth)
-    channel = grpc.aio.secure_channel(GEYSER_ENDPOINT, creds)
+    channel = grpc.aio.secure_channel(GEYSER_ENDPOINT, creds, options=GRPC_CHANNEL_OPTIONS)
     return geyser_pb2_grpc.GeyserStub(channel)
 
 
 def create_subscription_request():
     """Create a subscription request for LetsBonk transactions."""
     request = geyser_pb2.SubscribeRequest()
-    # Monitor transactions that include both Raydium LaunchLab and LetsBonk Platform Config
-    request.transactions["letsbonk_filter"].account_required.append(str(RAYDIUM_LAUNCHLAB_ID))
-    request.transactions["letsbonk_filter"].account_required.append(str(LETSBONK_PLATFORM_CONFIG_ID))
+    # Monitor transactions that include both Raydium LaunchLab and LetsBonk
+    # Platform Config; also require the Metaplex metadata program and the rent
+    # sysvar, which among LaunchLab flows only initialize touches - this
+    # rejects buys/sells server-side before they ever hit the wire
+    request.transactions["letsbonk_filter"].account_required.append(RAYDIUM_LAUNCHLAB_STR)
+    request.transactions["letsbonk_filter"].account_required.append(LETSBONK_PLATFORM_CONFIG_STR)
+    request.transactions["letsbonk_filter"].account_required.append(METAPLEX_METADATA_STR)
+    request.transactions["letsbonk_filter"].account_required.append(RENT_SYSVAR_STR)
     request.transactions["letsbonk_filter"].failed = False
     request.transactions["letsbonk_filter"].vote = False
     request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
@@ -68,61 +122,103 @@ def create_subscription_request():
 
 
 def print_token_info(decoded_data: Dict[str, Any], signature: str):
-    """Print formatted token information in a compact format."""
+    """Log formatted token information in a compact format."""
     if 'args' not in decoded_data or 'base_mint_param' not in decoded_data['args']:
-        print("⚠️  Could not extract token information")
+        logger.info("⚠️  Could not extract token information")
         return
     
     mint_params = decoded_data['args']['base_mint_param']
     accounts = decoded_data['accounts']
     
-    print(f"\n🚀 NEW TOKEN: {mint_params.get('name', 'N/A')} ({mint_params.get('symbol', 'N/A')})")
-    print(f"   Signature: {signature}")
-    print(f"   Creator: {accounts.get('creator', 'N/A')}")
-    print(f"   Base Mint: {accounts.get('base_mint', 'N/A')}")
-    print(f"   Pool: {accounts.get('pool_state', 'N/A')}")
+    lines = [
+        f"\n🚀 NEW TOKEN: {mint_params.get('name', 'N/A')} ({mint_params.get('symbol', 'N/A')})",
+        f"   Signature: {signature}",
+        f"   Creator: {accounts.get('creator', 'N/A')}",
+        f"   Base Mint: {accounts.get('base_mint', 'N/A')}",
+        f"   Pool: {accounts.get('pool_state', 'N/A')}",
+    ]
     if mint_params.get('uri'):
-        print(f"   Metadata: {mint_params['uri']}")
-    print("   " + "="*60)
+        lines.append(f"   Metadata: {mint_params['uri']}")
+    lines.append("   " + "="*60)
+    logger.info("\n".join(lines))
+
+
+def process_update(update, parser):
+    """Decode a single transaction update and print any detected token creation."""
+    tx = update.transaction.transaction.transaction
+    msg = getattr(tx, "message", None)
+    if msg is None:
+        return
+
+    # Locate the Raydium LaunchLab program once per transaction so instructions
+    # from other programs are skipped without inspecting their data
+    raydium_program_idx = -1
+    for idx, key in enumerate(msg.account_keys):
+        if key == RAYDIUM_LAUNCHLAB_RAW:
+            raydium_program_idx = idx
+            break
+    if raydium_program_idx < 0:
+        return
+
+    for ix in msg.instructions:
+        if ix.program_id_index != raydium_program_idx:
+            continue
+
+        # Single int-keyed lookup on the 8-byte discriminator rejects
+        # anything that is not a known instruction
+        ix_data = ix.data
+        if len(ix_data) < 8:
+            continue
+        instruction = parser.instructions.get(_DISC_U64.unpack_from(ix_data)[0])
+        if instruction is None or instruction['name'] != 'initialize':
+            continue
+
+        # Decode the instruction using IDL; encode the signature only once a
+        # decode succeeds - protobuf already hands us bytes, so no extra copy
+        decoded_data = parser.decode_instruction(ix_data, msg.account_keys, ix.accounts)
+        if decoded_data:
+            signature = base58.b58encode(update.transaction.transaction.signature).decode()
+            print_token_info(decoded_data, signature)
+        else:
+            logger.info("⚠️  Failed to decode - likely not token creation")
 
 
 async def monitor_letsbonk():
     """Monitor Solana blockchain for new LetsBonk token creations."""
     print(f"Starting LetsBonk token monitor using {AUTH_TYPE.upper()} authentication")
     print("Monitoring for transactions containing both:")
-    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_ID}")
-    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_ID}")
-    
+    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_STR}")
+    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_STR}")
+
     # Initialize IDL parser
     idl_path = "idl/raydium_launchlab.json"
     parser = load_idl_parser(idl_path, verbose=True)
-    
+
     stub = await create_geyser_connection()
     request = create_subscription_request()
-    
-    async for update in stub.Subscribe(iter([request])):        
-        tx = update.transaction.transaction.transaction
-        msg = getattr(tx, "message", None)
-        if msg is None:
-            continue
-        
-        for _, ix in enumerate(msg.instructions):
-            if not ix.data.startswith(INITIALIZE_DISCRIMINATOR):
-                continue
 
-            signature = base58.b58encode(bytes(update.transaction.transaction.signature)).decode()
-            
-            # Validate basic instruction data length
-            if len(ix.data) < 8:
-                print(f"⚠️  Short instruction data - likely not token creation | {signature}")
+    # Decouple receiving from decoding so a slow decode never stalls the gRPC
+    # receive window: the reader only enqueues, worker tasks drain the queue
+    queue: asyncio.Queue = asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE)
+
+    async def receive_updates():
+        async for update in stub.Subscribe(iter([request])):
+            # Skip pings/slot notices before they ever touch the queue; one
+            # WhichOneof call is cheaper than a HasField presence check
+            if update.WhichOneof("update_oneof") != "transaction":
                 continue
-            
-            # Decode the instruction using IDL
-            decoded_data = parser.decode_instruction(ix.data, msg.account_keys, ix.accounts)
-            if decoded_data and decoded_data['instruction_name'] == 'initialize':
-                print_token_info(decoded_data, signature)
-            elif not decoded_data:
-                print(f"⚠️  Failed to decode - likely not token creation | {signature}")
+            try:
+                queue.put_nowait(update)
+            except asyncio.QueueFull:
+                logger.warning("⚠️  Update queue full - dropping transaction update")
+
+    async def decode_worker():
+        while True:
+            update = await queue.get()
+            process_update(update, parser)
+            queue.task_done()
+
+    await asyncio.gather(receive_updates(), *(decode_worker() for _ in range(NUM_DECODE_WORKERS)))
 
 
 if __name__ == "__main__":
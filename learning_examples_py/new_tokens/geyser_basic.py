@@ -11,9 +11,11 @@ This listener monitors for transactions that include both:
 """
 
 import asyncio
+import concurrent.futures
 import os
 import struct
-from typing import Dict, Any
+from functools import lru_cache
+from typing import NamedTuple
 import sys
 
 import base58
@@ -22,7 +24,21 @@ from dotenv import load_dotenv
 from solders.pubkey import Pubkey
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Prefer the native (upb) protobuf backend; the pure-Python fallback is
+# 25-100x slower on deserialization-heavy streams like this one
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
 from generated import geyser_pb2, geyser_pb2_grpc
+from google.protobuf.internal import api_implementation
+
+try:
+    # Optional Rust-backed base58 (PyO3); an order of magnitude faster than the
+    # pure-Python big-integer loop in the base58 package
+    from based58 import b58encode as _b58encode
+except ImportError:
+    _b58encode = base58.b58encode
+
+if api_implementation.Type() == "python":
+    print("⚠️  protobuf is using its pure-Python backend; reinstall protobuf with the native extension for much faster parsing")
 
 
 load_dotenv()
@@ -32,6 +48,24 @@ GEYSER_API_TOKEN = os.getenv("GEYSER_API_TOKEN")
 # Default to x-token auth, can be set to "basic"
 AUTH_TYPE = "x-token"
 
+# Token decodes run in a small process pool so a burst of creations never
+# blocks the coroutine draining the gRPC stream (workers start lazily on the
+# first submit, so importing this module stays cheap)
+DECODE_POOL_WORKERS = 4
+_decode_pool = concurrent.futures.ProcessPoolExecutor(max_workers=DECODE_POOL_WORKERS)
+
+# Channel tuning for a long-lived, high-rate stream: larger receive window and
+# message cap, plus keepalive pings so quiet periods don't drop the connection
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 10_000),
+    ("grpc.keepalive_timeout_ms", 5_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10_000),
+    ("grpc.http2.bdp_probe", 1),
+]
+
 # LetsBonk related program IDs
 RAYDIUM_LAUNCHLAB_ID = Pubkey.from_string("LanMV9sAd7wArD4vJFi2qDdfnVhFxYSUg6eADduJ3uj")
 LETSBONK_PLATFORM_CONFIG_ID = Pubkey.from_string("FfYek5vEz23cMkWsdJwG2oa6EphsvXSHrGpdALN4g6W1")
@@ -39,118 +73,132 @@ LETSBONK_PLATFORM_CONFIG_ID = Pubkey.from_string("FfYek5vEz23cMkWsdJwG2oa6EphsvX
 # Initialize instruction discriminator from IDL
 INITIALIZE_DISCRIMINATOR = bytes([175, 175, 109, 31, 13, 152, 155, 237])
 
+# Precompiled field readers: struct.unpack_from with a literal format string
+# re-parses the format on every call, Struct objects compile it once
+_U32 = struct.Struct("<I")
+
+# Curve payload plus vesting tail in one unpack per variant: ConstantCurve is
+# supply/total_base_sell/total_quote_fund_raising/migrate_type while Fixed and
+# Linear drop total_base_sell; the trailing three u64s are VestingParams
+_TAIL_CONSTANT = struct.Struct("<QQQBQQQ")
+_TAIL_FIXED_LINEAR = struct.Struct("<QQBQQQ")
+
+# Precomputed forms of the program IDs: base58 strings for the subscription
+# request, raw 32 bytes for comparisons against the native account_keys payload
+RAYDIUM_LAUNCHLAB_STR = str(RAYDIUM_LAUNCHLAB_ID)
+LETSBONK_PLATFORM_CONFIG_STR = str(LETSBONK_PLATFORM_CONFIG_ID)
+RAYDIUM_LAUNCHLAB_RAW = bytes(RAYDIUM_LAUNCHLAB_ID)
+
+# Accounts that only the initialize path references (from the IDL's fixed
+# accounts): used to tighten the server-side subscription filter
+METAPLEX_METADATA_STR = "metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s"
+RENT_SYSVAR_STR = "SysvarRent111111111111111111111111111111111"
+
 
-def decode_create_instruction(ix_data: bytes, keys, accounts) -> dict:
+@lru_cache(maxsize=4096)
+def _b58_cached(raw: bytes) -> str:
+    """Base58-encode one raw key, memoized: the program and sysvar keys in an
+    initialize instruction repeat across every token creation in the stream."""
+    return _b58encode(raw).decode()
+
+
+class TokenInfo(NamedTuple):
+    """Decoded initialize instruction: MintParams fields followed by the
+    instruction accounts in IDL order. A fixed-shape NamedTuple skips the
+    per-token dict allocation and string-key hashing of the old dict result."""
+    name: str
+    symbol: str
+    uri: str
+    decimals: int
+    total_locked_amount: int
+    cliff_period: int
+    unlock_period: int
+    curve_variant: int
+    payer: str
+    creator: str
+    global_config: str
+    platform_config: str
+    authority: str
+    pool_state: str
+    base_mint: str
+    quote_mint: str
+    base_vault: str
+    quote_vault: str
+    metadata_account: str
+    base_token_program: str
+    quote_token_program: str
+    metadata_program: str
+    system_program: str
+    rent_program: str
+
+
+def encode_keys(raw_keys) -> list:
+    """Base58-encode a batch of raw account keys in one pass."""
+    b58 = _b58_cached
+    return [b58(k) for k in raw_keys]
+
+
+def decode_create_instruction(ix_data: bytes, keys, accounts) -> TokenInfo:
     """Decode a create instruction from transaction data based on IDL structure."""
     # Skip past the 8-byte discriminator prefix
     offset = 8
     
-    # Extract account keys in base58 format
-    def get_account_key(index):
-        if index >= len(accounts):
-            return "N/A"
-        account_index = accounts[index]
-        if account_index >= len(keys):
-            return "N/A"
-        return base58.b58encode(keys[account_index]).decode()
+    # Resolve the 16 account slots the instruction uses in a single batch pass
+    # instead of one closure call (with two bounds checks) per field
+    n_keys = len(keys)
+    slots = ["N/A"] * 16
+    in_range = [(i, accounts[i]) for i in range(min(16, len(accounts)))
+                if accounts[i] < n_keys]
+    encoded = encode_keys([keys[account_index] for _, account_index in in_range])
+    for (i, _), encoded_key in zip(in_range, encoded):
+        slots[i] = encoded_key
+    
+    # Parse base_mint_param (MintParams struct) inline: the closure-based
+    # readers this replaces cost a call frame and a nonlocal cell write per
+    # field, which dominates a parse this small
+    data_len = len(ix_data)
+    if offset >= data_len:
+        raise ValueError(f"Not enough data for u8 at offset {offset}")
+    decimals = ix_data[offset]
+    offset += 1
     
-    # Read string fields (prefixed with length)
-    def read_string():
-        nonlocal offset
-        if offset + 4 > len(ix_data):
+    fields = []
+    for _ in range(3):  # name, symbol, uri (length-prefixed strings)
+        if offset + 4 > data_len:
             raise ValueError(f"Not enough data for string length at offset {offset}")
-        # Get string length (4-byte uint)
-        length = struct.unpack_from("<I", ix_data, offset)[0]
+        length = _U32.unpack_from(ix_data, offset)[0]
         offset += 4
-        if offset + length > len(ix_data):
+        end = offset + length
+        if end > data_len:
             raise ValueError(f"Not enough data for string of length {length} at offset {offset}")
-        # Extract and decode the string
-        value = ix_data[offset:offset + length].decode()
-        offset += length
-        return value
-    
-    def read_u8():
-        nonlocal offset
-        if offset + 1 > len(ix_data):
-            raise ValueError(f"Not enough data for u8 at offset {offset}")
-        value = struct.unpack_from("<B", ix_data, offset)[0]
-        offset += 1
-        return value
-    
-    def read_u64():
-        nonlocal offset
-        if offset + 8 > len(ix_data):
-            raise ValueError(f"Not enough data for u64 at offset {offset}")
-        value = struct.unpack_from("<Q", ix_data, offset)[0]
-        offset += 8
-        return value
-    
-    # Parse base_mint_param (MintParams struct)
-    decimals = read_u8()
-    name = read_string()
-    symbol = read_string()
-    uri = read_string()
+        fields.append(ix_data[offset:end].decode())
+        offset = end
+    name, symbol, uri = fields
     
     # Parse curve_param (CurveParams enum)
-    curve_variant = read_u8()  # enum discriminator
+    if offset >= data_len:
+        raise ValueError(f"Not enough data for u8 at offset {offset}")
+    curve_variant = ix_data[offset]  # enum discriminator
+    offset += 1
     
-    # Skip curve data based on variant
+    # Unpack the curve payload and vesting_param (VestingParams) in a single
+    # call per variant; the skipped curve fields come out of the same tuple
     if curve_variant == 0:  # Constant
-        # ConstantCurve: supply(u64), total_base_sell(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 8 + 1  # 25 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for ConstantCurve at offset {offset}")
-        offset += skip_bytes
-    elif curve_variant == 1:  # Fixed
-        # FixedCurve: supply(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 1  # 17 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for FixedCurve at offset {offset}")
-        offset += skip_bytes
-    elif curve_variant == 2:  # Linear
-        # LinearCurve: supply(u64), total_quote_fund_raising(u64), migrate_type(u8)
-        skip_bytes = 8 + 8 + 1  # 17 bytes
-        if offset + skip_bytes > len(ix_data):
-            raise ValueError(f"Not enough data for LinearCurve at offset {offset}")
-        offset += skip_bytes
+        tail = _TAIL_CONSTANT
+    elif curve_variant == 1 or curve_variant == 2:  # Fixed / Linear
+        tail = _TAIL_FIXED_LINEAR
     else:
         # Unknown variant, try to continue but might fail
         raise ValueError(f"Unknown curve variant: {curve_variant}")
+    if offset + tail.size > len(ix_data):
+        raise ValueError(f"Not enough data for curve variant {curve_variant} at offset {offset}")
+    total_locked_amount, cliff_period, unlock_period = tail.unpack_from(ix_data, offset)[-3:]
+    offset += tail.size
     
-    # Parse vesting_param (VestingParams struct)
-    total_locked_amount = read_u64()
-    cliff_period = read_u64()
-    unlock_period = read_u64()
-    
-    token_info = {
-        "name": name,
-        "symbol": symbol,
-        "uri": uri,
-        "decimals": decimals,
-        "total_locked_amount": total_locked_amount,
-        "cliff_period": cliff_period,
-        "unlock_period": unlock_period,
-        "curve_variant": curve_variant,
-        # Account mappings based on IDL
-        "payer": get_account_key(0),
-        "creator": get_account_key(1),
-        "global_config": get_account_key(2),
-        "platform_config": get_account_key(3),
-        "authority": get_account_key(4),
-        "pool_state": get_account_key(5),
-        "base_mint": get_account_key(6),
-        "quote_mint": get_account_key(7),
-        "base_vault": get_account_key(8),
-        "quote_vault": get_account_key(9),
-        "metadata_account": get_account_key(10),
-        "base_token_program": get_account_key(11),
-        "quote_token_program": get_account_key(12),
-        "metadata_program": get_account_key(13),
-        "system_program": get_account_key(14),
-        "rent_program": get_account_key(15),
-    }
-        
-    return token_info
+    # The 16 slots land positionally after the MintParams/vesting fields;
+    # slot order matches the IDL account order baked into TokenInfo
+    return TokenInfo(name, symbol, uri, decimals, total_locked_amount,
+                     cliff_period, unlock_period, curve_variant, *slots)
 
 
 async def create_geyser_connection():
@@ -165,32 +213,37 @@ async def create_geyser_connection():
         )
     
     creds = grpc.composite_channel_credentials(grpc.ssl_channel_credentials(), auth)
-    channel = grpc.aio.secure_channel(GEYSER_ENDPOINT, creds)
+    channel = grpc.aio.secure_channel(GEYSER_ENDPOINT, creds, options=GRPC_CHANNEL_OPTIONS)
     return geyser_pb2_grpc.GeyserStub(channel)
 
 
 def create_subscription_request():
     """Create a subscription request for LetsBonk transactions."""
     request = geyser_pb2.SubscribeRequest()
-    # Monitor transactions that include both Raydium LaunchLab and LetsBonk Platform Config
-    request.transactions["letsbonk_filter"].account_required.append(str(RAYDIUM_LAUNCHLAB_ID))
-    request.transactions["letsbonk_filter"].account_required.append(str(LETSBONK_PLATFORM_CONFIG_ID))
+    # Monitor transactions that include both Raydium LaunchLab and LetsBonk
+    # Platform Config; also require the Metaplex metadata program and the rent
+    # sysvar, which among LaunchLab flows only initialize touches - this
+    # rejects buys/sells server-side before they ever hit the wire
+    request.transactions["letsbonk_filter"].account_required.append(RAYDIUM_LAUNCHLAB_STR)
+    request.transactions["letsbonk_filter"].account_required.append(LETSBONK_PLATFORM_CONFIG_STR)
+    request.transactions["letsbonk_filter"].account_required.append(METAPLEX_METADATA_STR)
+    request.transactions["letsbonk_filter"].account_required.append(RENT_SYSVAR_STR)
     request.transactions["letsbonk_filter"].failed = False
     request.transactions["letsbonk_filter"].vote = False
     request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
     return request
 
 
-def print_token_info(token_info: Dict[str, Any], signature: str):
+def print_token_info(token_info: TokenInfo, signature: str):
     """Print formatted token information in a compact format."""
-    print(f"\n🚀 NEW TOKEN: {token_info.get('name', 'N/A')} ({token_info.get('symbol', 'N/A')})")
+    print(f"\n🚀 NEW TOKEN: {token_info.name} ({token_info.symbol})")
     print(f"   Signature: {signature}")
-    print(f"   Creator: {token_info.get('creator', 'N/A')}")
-    print(f"   Base Mint: {token_info.get('base_mint', 'N/A')}")
-    print(f"   Pool State: {token_info.get('pool_state', 'N/A')}")
-    print(f"   Metadata: {token_info.get('metadata_account', 'N/A')}")
-    if token_info.get('uri'):
-        print(f"   Metadata URI: {token_info['uri']}")
+    print(f"   Creator: {token_info.creator}")
+    print(f"   Base Mint: {token_info.base_mint}")
+    print(f"   Pool State: {token_info.pool_state}")
+    print(f"   Metadata: {token_info.metadata_account}")
+    if token_info.uri:
+        print(f"   Metadata URI: {token_info.uri}")
     print("   " + "="*60)
 
 
@@ -198,38 +251,85 @@ async def monitor_letsbonk():
     """Monitor Solana blockchain for new LetsBonk token creations."""
     print(f"Starting LetsBonk token monitor using {AUTH_TYPE.upper()} authentication")
     print("Monitoring for transactions containing both:")
-    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_ID}")
-    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_ID}")
+    print(f"  - Raydium LaunchLab: {RAYDIUM_LAUNCHLAB_STR}")
+    print(f"  - LetsBonk Platform Config: {LETSBONK_PLATFORM_CONFIG_STR}")
     
     stub = await create_geyser_connection()
     request = create_subscription_request()
+    loop = asyncio.get_running_loop()
     
     async for update in stub.Subscribe(iter([request])):
+        # Skip pings/slot notices up front; one WhichOneof call is cheaper
+        # than a HasField presence check
+        if update.WhichOneof("update_oneof") != "transaction":
+            continue
         tx = update.transaction.transaction.transaction
         msg = getattr(tx, "message", None)
         if msg is None:
             continue
-        
-        for _, ix in enumerate(msg.instructions):
-            if not ix.data.startswith(INITIALIZE_DISCRIMINATOR):
+
+        # Hoist repeated-field accesses out of the instruction loop: each
+        # attribute read on a protobuf message crosses into the C backend
+        account_keys = msg.account_keys
+        instructions = msg.instructions
+        disc = INITIALIZE_DISCRIMINATOR
+
+        # Locate the Raydium LaunchLab program once per transaction so instructions
+        # from other programs are skipped without inspecting their data
+        raydium_program_idx = -1
+        for idx, key in enumerate(account_keys):
+            if key == RAYDIUM_LAUNCHLAB_RAW:
+                raydium_program_idx = idx
+                break
+        if raydium_program_idx < 0:
+            continue
+
+        # Base58-encoding the signature is the priciest step on the warning
+        # path, so it runs at most once per transaction and only after an
+        # instruction actually matches
+        signature = None
+        for ix in instructions:
+            if ix.program_id_index != raydium_program_idx:
                 continue
-            
-            signature = base58.b58encode(bytes(update.transaction.transaction.signature)).decode()
+            ix_data = ix.data
+            # startswith is a C-level memcmp with no 8-byte slice allocation
+            if not ix_data.startswith(disc):
+                continue
+            ix_accounts = ix.accounts
+
+            if signature is None:
+                signature = _b58encode(update.transaction.transaction.signature).decode()
             
             # Token creation should have substantial data and many accounts
-            if len(ix.data) <= 8 or len(ix.accounts) < 10:
-                print(f"⚠️  Likely non-creation tx (data: {len(ix.data)}B, accounts: {len(ix.accounts)}) | {signature[:16]}...")
+            if len(ix_data) <= 8 or len(ix_accounts) < 10:
+                print(f"⚠️  Likely non-creation tx (data: {len(ix_data)}B, accounts: {len(ix_accounts)}) | {signature[:16]}...")
                 continue
             
-            # Decode the instruction using simple parsing
-            try:
-                token_info = decode_create_instruction(ix.data, msg.account_keys, ix.accounts)
-                print_token_info(token_info, signature)
-            except Exception as e:
-                print(f"⚠️  Failed to decode instruction: {e}")
-                print(f"   Signature: {signature}")
-                print(f"   Data length: {len(ix.data)}, Accounts: {len(ix.accounts)}, Keys: {len(msg.account_keys)}")
-                print("   " + "-"*60)
+            # Ship the decode to the process pool; everything crossing the
+            # boundary is plain bytes/ints, so pickling stays cheap and the
+            # stream coroutine moves straight on to the next update
+            future = loop.run_in_executor(
+                _decode_pool,
+                decode_create_instruction,
+                bytes(ix_data),
+                list(account_keys),
+                list(ix_accounts),
+            )
+            future.add_done_callback(
+                lambda fut, signature=signature: _emit_decoded(fut, signature)
+            )
+
+
+def _emit_decoded(future, signature: str):
+    """Print the result of an off-loop decode (runs on the event loop)."""
+    try:
+        token_info = future.result()
+    except Exception as e:
+        print(f"⚠️  Failed to decode instruction: {e}")
+        print(f"   Signature: {signature}")
+        print("   " + "-"*60)
+    else:
+        print_token_info(token_info, signature)
 
 
 if __name__ == "__main__":